@@ -207,6 +207,9 @@ class LLMClient:
             kwargs["max_tokens"] = request.max_tokens
         if request.top_p is not None:
             kwargs["top_p"] = request.top_p
+        if request.response_format is not None:
+            # LiteLLM translates this per provider (and drops it where unsupported)
+            kwargs["response_format"] = request.response_format
 
         # Add tools if provided
         tools = self._build_tools(request)
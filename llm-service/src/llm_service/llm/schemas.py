@@ -138,6 +138,10 @@ class ChatRequest(BaseModel):
     top_p: float | None = Field(
         default=None, ge=0, le=1, description="Nucleus sampling parameter"
     )
+    response_format: dict[str, Any] | None = Field(
+        default=None,
+        description="Structured output format (e.g., json_object or json_schema)",
+    )
 
 
 class ToolCall(BaseModel):
@@ -10,6 +10,8 @@ from .models import (
     Position,
     Portfolio,
     Candlestick,
+    PriceHistory,
+    PriceHistoryView,
     MarketState,
     SimulationConfig,
     ModelScore,
@@ -17,7 +19,7 @@ from .models import (
     SimulationResult,
 )
 from .replay import MarketReplayEngine
-from .decision import LLMDecisionEngine, DecisionResult
+from .decision import LLMDecisionEngine, DecisionResult, ResponseCache
 from .portfolio import PortfolioManager, TradeExecution
 from .scoring import ScoringEngine
 from .simulation import TruthBenchSimulation
@@ -30,6 +32,8 @@ __all__ = [
     "Position",
     "Portfolio",
     "Candlestick",
+    "PriceHistory",
+    "PriceHistoryView",
     "MarketState",
     "SimulationConfig",
     "ModelScore",
@@ -39,6 +43,7 @@ __all__ = [
     "MarketReplayEngine",
     "LLMDecisionEngine",
     "DecisionResult",
+    "ResponseCache",
     "PortfolioManager",
     "TradeExecution",
     "ScoringEngine",
@@ -17,6 +17,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 
+from .decision import ResponseCache
 from .models import SimulationConfig, SimulationResult
 from .simulation import TruthBenchSimulation
 
@@ -31,6 +32,13 @@ _simulation_task: asyncio.Task | None = None
 _simulation_result: SimulationResult | None = None
 _llm_client: Any = None
 
+# LLM responses shared by runs started with cache_llm_responses, so reruns
+# do not pay for identical calls again (bounded, least recently used first)
+_response_cache = ResponseCache()
+
+# Window over which WebSocket status updates are coalesced into one send
+_STREAM_COALESCE_INTERVAL = 0.1
+
 
 def set_llm_client(client: Any) -> None:
     """Set the LLM client for simulations."""
@@ -73,6 +81,20 @@ class StartSimulationRequest(BaseModel):
         default=3,
         description="Number of decision points per market",
     )
+    max_concurrent_llm_calls: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum LLM requests in flight at once",
+    )
+    cache_llm_responses: bool = Field(
+        default=False,
+        description="Reuse LLM responses to identical prompts across runs",
+    )
+    snapshot_every_n_decision_points: int = Field(
+        default=1,
+        ge=0,
+        description="P&L snapshot every N decision points (0 = after settlement only)",
+    )
 
 
 class SimulationStatusResponse(BaseModel):
@@ -133,6 +155,9 @@ async def start_simulation(request: StartSimulationRequest):
         max_position_pct=request.max_position_pct,
         max_markets=request.max_markets,
         min_volume=request.min_volume,
+        max_concurrent_llm_calls=request.max_concurrent_llm_calls,
+        cache_llm_responses=request.cache_llm_responses,
+        snapshot_every_n_decision_points=request.snapshot_every_n_decision_points,
     )
     
     # Model display names
@@ -148,6 +173,7 @@ async def start_simulation(request: StartSimulationRequest):
         config=config,
         llm_client=_llm_client,
         model_names=model_names,
+        response_cache=_response_cache,
     )
     _simulation_result = None
     
@@ -232,7 +258,7 @@ async def get_status():
                 "action": d.action.value,
                 "quantity": d.quantity,
                 "confidence": d.confidence,
-                "reasoning": d.reasoning[:100] + "..." if len(d.reasoning) > 100 else d.reasoning,
+                "reasoning": d.reasoning_short,
             }
             for d in status.recent_decisions
         ],
@@ -334,12 +360,42 @@ async def stream_updates(websocket: WebSocket):
         await websocket.close()
         return
     
+    # Each update is a full status snapshot, so only the newest one in a
+    # coalescing window needs to be sent.
+    simulation = _current_simulation
+    latest: dict | None = None
+    update_ready = asyncio.Event()
+    stream_done = False
+    
+    async def collect_updates():
+        nonlocal latest, stream_done
+        try:
+            async for update in simulation.stream_updates():
+                latest = update
+                update_ready.set()
+        finally:
+            stream_done = True
+            update_ready.set()
+    
+    collector = asyncio.create_task(collect_updates())
+    
     try:
-        async for update in _current_simulation.stream_updates():
-            await websocket.send_json({
-                "type": "status_update",
-                "data": update,
-            })
+        while True:
+            await update_ready.wait()
+            await asyncio.sleep(_STREAM_COALESCE_INTERVAL)
+            update_ready.clear()
+            
+            if latest is not None:
+                update, latest = latest, None
+                await websocket.send_json({
+                    "type": "status_update",
+                    "data": update,
+                })
+            
+            if stream_done:
+                # Surface any error raised while producing updates
+                await collector
+                break
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
     except Exception as e:
@@ -351,4 +407,5 @@ async def stream_updates(websocket: WebSocket):
             })
         except Exception:
             pass
-
+    finally:
+        collector.cancel()
@@ -5,9 +5,13 @@ parsing their responses, and managing rate limits across providers.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -43,6 +47,51 @@ You MUST respond with valid JSON in exactly this format:
   "reasoning": "<brief explanation>"
 }"""
 
+# Sampling parameters for decision requests
+_TEMPERATURE = 0.3  # Lower temperature for more consistent decisions
+_MAX_TOKENS = 500
+
+# Structured output schema for decisions. Providers that honor it return
+# bare JSON, so _parse_json_response succeeds on its first json.loads().
+DECISION_RESPONSE_FORMAT: dict = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "trading_decision",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["buy_yes", "buy_no", "hold", "sell_yes", "sell_no"],
+                },
+                "quantity": {"type": "integer"},
+                "confidence": {"type": "number"},
+                "probability_yes": {"type": "number"},
+                "reasoning": {"type": "string"},
+            },
+            "required": [
+                "action",
+                "quantity",
+                "confidence",
+                "probability_yes",
+                "reasoning",
+            ],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+# Accepted action strings -> Action (a bare "sell" defaults to selling YES)
+_ACTION_MAP: dict[str, Action] = {
+    "buy_yes": Action.BUY_YES,
+    "buy_no": Action.BUY_NO,
+    "hold": Action.HOLD,
+    "sell_yes": Action.SELL_YES,
+    "sell_no": Action.SELL_NO,
+    "sell": Action.SELL_YES,
+}
+
 
 def build_market_prompt(
     state: MarketState,
@@ -60,23 +109,20 @@ def build_market_prompt(
         Formatted prompt string
     """
     # Format price history summary
-    if state.price_history:
-        prices = [c.price_close for c in state.price_history if c.price_close]
-        if prices:
-            price_summary = (
-                f"Price started at {prices[0]}¢, "
-                f"now at {prices[-1]}¢ "
-                f"(high: {max(prices)}¢, low: {min(prices)}¢)"
-            )
-        else:
-            price_summary = "No price history available"
+    if state.price_range:
+        first, last, high, low = state.price_range
+        price_summary = (
+            f"Price started at {first}¢, "
+            f"now at {last}¢ "
+            f"(high: {high}¢, low: {low}¢)"
+        )
     else:
         price_summary = "No price history available"
     
     # Check existing position
     position_info = "You have no position in this market."
-    if state.ticker in portfolio.positions:
-        pos = portfolio.positions[state.ticker]
+    pos = portfolio.positions.get(state.ticker)
+    if pos is not None:
         position_info = (
             f"You hold {pos.quantity} {pos.side.upper()} contracts "
             f"at avg price {pos.avg_price}¢"
@@ -116,6 +162,36 @@ Remember to respond with valid JSON only.
     return prompt.strip()
 
 
+class ResponseCache(OrderedDict[str, str]):
+    """Bounded LRU mapping of request key -> raw LLM response text.
+    
+    Once ``maxsize`` entries are stored, adding another evicts the least
+    recently used one.
+    """
+    
+    def __init__(self, maxsize: int = 10_000):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of responses kept
+        """
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Get a response, marking it as most recently used."""
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+    
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 @dataclass
 class DecisionResult:
     """Result of an LLM decision query."""
@@ -136,15 +212,25 @@ class LLMDecisionEngine:
         self,
         llm_client: Any,  # LLMClient from llm_service
         rate_limit_delay: float = 1.0,
+        response_cache: MutableMapping[str, str] | None = None,
+        request_limiter: asyncio.Semaphore | None = None,
     ):
         """Initialize the decision engine.
         
         Args:
             llm_client: The LLM client for making API calls
             rate_limit_delay: Seconds to wait between API calls
+            response_cache: Optional mapping of request key -> raw response
+                text. Responses that parsed successfully are stored in it and
+                identical requests are answered from it without an API call.
+            request_limiter: Optional semaphore held only while a request is
+                in flight (not while waiting on the rate limit), capping
+                concurrent requests across engines sharing it
         """
         self.llm_client = llm_client
         self.rate_limit_delay = rate_limit_delay
+        self.response_cache = response_cache
+        self.request_limiter = request_limiter
         self._last_call_time: dict[str, float] = {}
         
         logger.info("LLMDecisionEngine initialized")
@@ -158,7 +244,8 @@ class LLMDecisionEngine:
         Returns:
             Parsed JSON dict or None if parsing fails
         """
-        # Try direct JSON parse first
+        # Try direct JSON parse first (the norm with structured outputs);
+        # the regex fallbacks only run for providers that ignore the schema
         try:
             return json.loads(response)
         except json.JSONDecodeError:
@@ -213,30 +300,17 @@ class LLMDecisionEngine:
         try:
             # Parse action
             action_str = parsed.get("action", "hold").lower()
-            action_map = {
-                "buy_yes": Action.BUY_YES,
-                "buy_no": Action.BUY_NO,
-                "hold": Action.HOLD,
-                "sell_yes": Action.SELL_YES,
-                "sell_no": Action.SELL_NO,
-                "sell": Action.SELL_YES,  # Default sell to YES
-            }
-            action = action_map.get(action_str, Action.HOLD)
+            action = _ACTION_MAP.get(action_str, Action.HOLD)
             
-            # Parse other fields with defaults
-            quantity = int(parsed.get("quantity", 0))
-            confidence = float(parsed.get("confidence", 50))
-            probability_yes = float(parsed.get("probability_yes", 0.5))
+            # Parse other fields with defaults, clamped to valid ranges
+            quantity = min(100, max(0, int(parsed.get("quantity", 0))))
+            confidence = min(100, max(0, float(parsed.get("confidence", 50))))
+            probability_yes = min(1.0, max(0.0, float(parsed.get("probability_yes", 0.5))))
             reasoning = str(parsed.get("reasoning", "No reasoning provided"))
             
-            # Validate ranges
-            quantity = max(0, min(100, quantity))
-            confidence = max(0, min(100, confidence))
-            probability_yes = max(0.0, min(1.0, probability_yes))
-            
             decision = TradingDecision(
-                model_id=model_id,
-                market_ticker=market_ticker,
+                model_id=sys.intern(model_id),
+                market_ticker=sys.intern(market_ticker),
                 timestamp=timestamp,
                 action=action,
                 quantity=quantity,
@@ -259,11 +333,18 @@ class LLMDecisionEngine:
                 error=f"Failed to parse decision fields: {e}",
             )
     
+    @staticmethod
+    def _cache_key(model_id: str, user_prompt: str) -> str:
+        """Content-addressed key for a decision request."""
+        request = f"{model_id}|{SYSTEM_PROMPT}|{user_prompt}|{_TEMPERATURE}"
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+    
     async def get_decision(
         self,
         model_id: str,
         state: MarketState,
         portfolio: Portfolio,
+        user_prompt: str | None = None,
     ) -> DecisionResult:
         """Get a trading decision from an LLM.
         
@@ -271,22 +352,45 @@ class LLMDecisionEngine:
             model_id: The LLM model to query
             state: Current market state
             portfolio: LLM's current portfolio
+            user_prompt: Prompt already built from state and portfolio by
+                build_market_prompt (built here if omitted)
             
         Returns:
             DecisionResult with the decision or error
         """
-        # Rate limiting
-        import time
-        now = time.time()
-        if model_id in self._last_call_time:
-            elapsed = now - self._last_call_time[model_id]
+        # Build prompt
+        if user_prompt is None:
+            user_prompt = build_market_prompt(state, portfolio)
+        
+        # Serve repeated requests from the response cache, skipping both
+        # the rate limit and the API call
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self._cache_key(model_id, user_prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(
+                    f"Cached decision for {model_id} on {state.ticker}",
+                    extra={"model": model_id, "market": state.ticker},
+                )
+                return self._parse_decision(
+                    cached,
+                    model_id,
+                    state.ticker,
+                    state.current_timestamp,
+                )
+        
+        # Rate limiting (event loop clock is monotonic)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        last_call = self._last_call_time.get(model_id)
+        if last_call is not None:
+            elapsed = now - last_call
             if elapsed < self.rate_limit_delay:
                 await asyncio.sleep(self.rate_limit_delay - elapsed)
+                now = loop.time()
         
-        self._last_call_time[model_id] = time.time()
-        
-        # Build prompt
-        user_prompt = build_market_prompt(state, portfolio)
+        self._last_call_time[model_id] = now
         
         logger.debug(
             f"Querying {model_id} for decision on {state.ticker}",
@@ -303,11 +407,16 @@ class LLMDecisionEngine:
                     ChatMessage(role="system", content=SYSTEM_PROMPT),
                     ChatMessage(role="user", content=user_prompt),
                 ],
-                temperature=0.3,  # Lower temperature for more consistent decisions
-                max_tokens=500,
+                temperature=_TEMPERATURE,
+                max_tokens=_MAX_TOKENS,
+                response_format=DECISION_RESPONSE_FORMAT,
             )
             
-            response = await self.llm_client.achat_completion(request)
+            if self.request_limiter is None:
+                response = await self.llm_client.achat_completion(request)
+            else:
+                async with self.request_limiter:
+                    response = await self.llm_client.achat_completion(request)
             response_text = response.message.content or ""
             
             result = self._parse_decision(
@@ -318,6 +427,8 @@ class LLMDecisionEngine:
             )
             
             if result.success:
+                if cache_key is not None:
+                    self.response_cache[cache_key] = response_text
                 logger.info(
                     f"{model_id} decided {result.decision.action.value} "
                     f"on {state.ticker}",
@@ -364,25 +475,25 @@ class LLMDecisionEngine:
         Returns:
             Dict of model_id -> DecisionResult
         """
-        tasks = []
-        for model_id in model_ids:
-            portfolio = portfolios.get(model_id)
-            if portfolio:
-                tasks.append(self.get_decision(model_id, state, portfolio))
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        decision_map = {}
-        for model_id, result in zip(model_ids, results):
-            if isinstance(result, Exception):
-                decision_map[model_id] = DecisionResult(
+        async def decide(model_id: str) -> DecisionResult:
+            try:
+                return await self.get_decision(
+                    model_id, state, portfolios[model_id]
+                )
+            except Exception as e:
+                return DecisionResult(
                     success=False,
                     decision=None,
                     raw_response="",
-                    error=str(result),
+                    error=str(e),
                 )
-            else:
-                decision_map[model_id] = result
         
-        return decision_map
-
+        # TaskGroup cancels any in-flight requests if this call is cancelled
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                model_id: tg.create_task(decide(model_id))
+                for model_id in model_ids
+                if model_id in portfolios
+            }
+        
+        return {model_id: task.result() for model_id, task in tasks.items()}
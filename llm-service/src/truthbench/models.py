@@ -4,15 +4,20 @@ This module defines the core data structures used throughout the simulation:
 - TradingDecision: An LLM's decision on a market
 - Position: A holding in a specific market
 - Portfolio: An LLM's complete trading state
+- PriceHistory: Column-wise candlestick history of a market
+- PriceHistoryView: Read-only prefix of a PriceHistory
 - MarketState: Current state of a market at a timestep
 - SimulationConfig: Configuration for running a simulation
 - SimulationStatus: Real-time status of a running simulation
 - SimulationResult: Final results and scores
 """
 
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from typing import Literal
 
 
@@ -25,10 +30,12 @@ class Action(str, Enum):
     SELL_NO = "sell_no"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradingDecision:
     """A trading decision made by an LLM.
     
+    Decisions are immutable once made.
+    
     Attributes:
         model_id: The LLM model identifier
         market_ticker: The Kalshi market ticker
@@ -38,6 +45,8 @@ class TradingDecision:
         confidence: Confidence level 0-100
         reasoning: LLM's explanation for the decision
         probability_yes: LLM's estimated probability of YES outcome (0-1)
+        reasoning_short: ``reasoning`` truncated to 100 characters for
+            status displays (derived, not an init argument)
     """
     model_id: str
     market_ticker: str
@@ -47,9 +56,15 @@ class TradingDecision:
     confidence: float
     reasoning: str
     probability_yes: float = 0.5
+    reasoning_short: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        reasoning = self.reasoning
+        short = reasoning[:100] + "..." if len(reasoning) > 100 else reasoning
+        object.__setattr__(self, "reasoning_short", short)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """A position held in a market.
     
@@ -65,9 +80,17 @@ class Position:
     quantity: int
     avg_price: float
     entry_timestamp: int
+    
+    def as_summary(self) -> dict:
+        """Get the side, quantity and average price as a dict."""
+        return {
+            "side": self.side,
+            "quantity": self.quantity,
+            "avg_price": self.avg_price,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """An LLM's complete trading state.
     
@@ -78,9 +101,12 @@ class Portfolio:
         initial_bankroll: Starting bankroll for ROI calculation
         positions: Dict of market_ticker -> Position
         pnl_history: List of {timestamp, bankroll, unrealized_pnl}
-        decisions: List of all trading decisions made
+        decisions: Most recent trading decisions (bounded ring buffer)
+        total_decisions: Count of all trading decisions made
         total_trades: Count of executed trades
         winning_trades: Count of profitable trades
+        realized_pnl: Running P&L from closed trades and settlements (cents)
+        positions_stake: Open contracts valued at a neutral 50¢ each (cents)
     """
     model_id: str
     model_name: str
@@ -88,12 +114,17 @@ class Portfolio:
     initial_bankroll: float
     positions: dict[str, Position] = field(default_factory=dict)
     pnl_history: list[dict] = field(default_factory=list)
-    decisions: list[TradingDecision] = field(default_factory=list)
+    decisions: deque[TradingDecision] = field(
+        default_factory=lambda: deque(maxlen=1024)
+    )
+    total_decisions: int = 0
     total_trades: int = 0
     winning_trades: int = 0
+    realized_pnl: float = 0.0
+    positions_stake: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Candlestick:
     """A single candlestick data point.
     
@@ -113,7 +144,159 @@ class Candlestick:
     open_interest: int
 
 
-@dataclass
+def _price_range(
+    closes: Iterable[float],
+) -> tuple[float, float, float, float] | None:
+    """Get (first, last, high, low) of the non-zero prices in closes."""
+    prices = [p for p in closes if p]
+    if not prices:
+        return None
+    return prices[0], prices[-1], max(prices), min(prices)
+
+
+@dataclass(slots=True)
+class PriceHistory:
+    """Candlestick history stored column-wise (structure of arrays).
+    
+    Each attribute is a parallel list holding one candlestick field, so
+    passes over a single field (e.g. closing prices) touch only that
+    column. Candlestick rows are rebuilt on demand for row-wise callers.
+    
+    Attributes:
+        timestamps: Unix timestamp of each candlestick
+        yes_bid: Best bid price for YES
+        yes_ask: Best ask price for YES
+        price_close: Last traded price
+        volume: Volume traded in period
+        open_interest: Total open contracts
+    """
+    timestamps: list[int] = field(default_factory=list)
+    yes_bid: list[float] = field(default_factory=list)
+    yes_ask: list[float] = field(default_factory=list)
+    price_close: list[float] = field(default_factory=list)
+    volume: list[int] = field(default_factory=list)
+    open_interest: list[int] = field(default_factory=list)
+    
+    @classmethod
+    def from_candlesticks(cls, candles: Iterable[Candlestick]) -> "PriceHistory":
+        """Build a history from candlestick rows."""
+        history = cls()
+        for candle in candles:
+            history.append(candle)
+        return history
+    
+    def append(self, candle: Candlestick) -> None:
+        """Append one candlestick row."""
+        self.timestamps.append(candle.timestamp)
+        self.yes_bid.append(candle.yes_bid)
+        self.yes_ask.append(candle.yes_ask)
+        self.price_close.append(candle.price_close)
+        self.volume.append(candle.volume)
+        self.open_interest.append(candle.open_interest)
+    
+    def price_range(self) -> tuple[float, float, float, float] | None:
+        """Get (first, last, high, low) of the non-zero closing prices."""
+        return _price_range(self.price_close)
+    
+    def prefix(self, n: int) -> "PriceHistoryView":
+        """Return a view of the first n candlesticks without copying."""
+        return PriceHistoryView(self, max(0, min(n, len(self))))
+    
+    def rows(self) -> Iterator[Candlestick]:
+        """Iterate over the history as Candlestick rows."""
+        for row in zip(
+            self.timestamps,
+            self.yes_bid,
+            self.yes_ask,
+            self.price_close,
+            self.volume,
+            self.open_interest,
+        ):
+            yield Candlestick(*row)
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __iter__(self) -> Iterator[Candlestick]:
+        return self.rows()
+    
+    def __getitem__(self, idx: int | slice) -> Candlestick | list[Candlestick]:
+        # Slices give a list of rows, as slicing a list of candlesticks did
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return Candlestick(
+            timestamp=self.timestamps[idx],
+            yes_bid=self.yes_bid[idx],
+            yes_ask=self.yes_ask[idx],
+            price_close=self.price_close[idx],
+            volume=self.volume[idx],
+            open_interest=self.open_interest[idx],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PriceHistoryView:
+    """Read-only view of the first ``end`` candlesticks of a PriceHistory.
+    
+    Nothing is copied when the view is created; a column is only sliced
+    out of the underlying history when it is accessed.
+    
+    Attributes:
+        history: The full underlying history
+        end: Number of leading candlesticks visible through the view
+    """
+    history: PriceHistory
+    end: int
+    
+    @property
+    def timestamps(self) -> list[int]:
+        return self.history.timestamps[:self.end]
+    
+    @property
+    def yes_bid(self) -> list[float]:
+        return self.history.yes_bid[:self.end]
+    
+    @property
+    def yes_ask(self) -> list[float]:
+        return self.history.yes_ask[:self.end]
+    
+    @property
+    def price_close(self) -> list[float]:
+        return self.history.price_close[:self.end]
+    
+    @property
+    def volume(self) -> list[int]:
+        return self.history.volume[:self.end]
+    
+    @property
+    def open_interest(self) -> list[int]:
+        return self.history.open_interest[:self.end]
+    
+    def price_range(self) -> tuple[float, float, float, float] | None:
+        """Get (first, last, high, low) of the non-zero closing prices."""
+        return _price_range(islice(self.history.price_close, self.end))
+    
+    def rows(self) -> Iterator[Candlestick]:
+        """Iterate over the visible candlesticks as Candlestick rows."""
+        return islice(self.history.rows(), self.end)
+    
+    def __len__(self) -> int:
+        return self.end
+    
+    def __iter__(self) -> Iterator[Candlestick]:
+        return self.rows()
+    
+    def __getitem__(self, idx: int | slice) -> Candlestick | list[Candlestick]:
+        if isinstance(idx, slice):
+            return [self.history[i] for i in range(*idx.indices(self.end))]
+        if idx < 0:
+            idx += self.end
+        if not 0 <= idx < self.end:
+            raise IndexError("price history index out of range")
+        return self.history[idx]
+
+
+@dataclass(slots=True)
 class MarketState:
     """Current state of a market at a specific timestep.
     
@@ -133,8 +316,10 @@ class MarketState:
         current_price: Last traded price
         volume: Total volume traded
         open_interest: Current open interest
-        price_history: List of candlesticks up to current time
+        price_history: Candlestick history up to current time
         result: Ground truth result (hidden from LLMs during simulation)
+        price_range: (first, last, high, low) of the non-zero closing prices
+            in price_history, or None if there are none
     """
     ticker: str
     title: str
@@ -148,8 +333,9 @@ class MarketState:
     current_price: float
     volume: int
     open_interest: int
-    price_history: list[Candlestick]
+    price_history: PriceHistory | PriceHistoryView
     result: str  # Hidden from LLMs, used for settlement
+    price_range: tuple[float, float, float, float] | None = None
 
 
 @dataclass
@@ -165,6 +351,23 @@ class SimulationConfig:
         max_markets: Limit number of markets (None = all)
         min_volume: Minimum market volume to include
         speed_multiplier: Simulation speed (1.0 = real-time replay)
+        max_concurrent_llm_calls: Max LLM requests in flight at once
+        cache_llm_responses: Reuse responses to identical prompts within the
+            run, or across runs that are given the same response cache
+        snapshot_every_n_decision_points: Record portfolio P&L snapshots at
+            every Nth decision point of each market (0 = one snapshot per
+            market, after it settles)
+        checkpoint_file: JSON Lines file recording each settled market. Markets
+            already recorded in it are restored instead of re-run, so an
+            interrupted simulation can be resumed; resuming with different
+            models or replay settings is refused (None = no checkpointing)
+        stream_trace_records: Write per-event trace records to an NDJSON file
+            as they happen instead of holding them until the trace is saved
+        max_trace_records: Max trace records of each kind kept in memory when
+            not streaming; the oldest are dropped (None = unbounded)
+        compress_traces: Save the trace file compressed (zstd or gzip)
+        trace_raw_on_success: Keep raw LLM responses in the trace even when
+            they parsed successfully (failed ones are always kept)
     """
     models: list[str]
     markets_file: str = "resolved_markets_with_history.json"
@@ -174,9 +377,29 @@ class SimulationConfig:
     max_markets: int | None = None
     min_volume: int = 1000
     speed_multiplier: float = 100.0  # 100x speed by default
+    max_concurrent_llm_calls: int = 8
+    cache_llm_responses: bool = False
+    snapshot_every_n_decision_points: int = 1
+    checkpoint_file: str | None = None
+    stream_trace_records: bool = False
+    max_trace_records: int | None = None
+    compress_traces: bool = False
+    trace_raw_on_success: bool = False
+    
+    def __post_init__(self) -> None:
+        if self.max_concurrent_llm_calls < 1:
+            raise ValueError(
+                "max_concurrent_llm_calls must be at least 1, "
+                f"got {self.max_concurrent_llm_calls}"
+            )
+        if self.snapshot_every_n_decision_points < 0:
+            raise ValueError(
+                "snapshot_every_n_decision_points must not be negative, "
+                f"got {self.snapshot_every_n_decision_points}"
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelScore:
     """Scoring metrics for a single model.
     
@@ -202,7 +425,7 @@ class ModelScore:
     sharpe_ratio: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationStatus:
     """Real-time status of a running simulation.
     
@@ -5,15 +5,18 @@ position management, and P&L calculation.
 """
 
 import logging
-from copy import deepcopy
+import sys
+from collections import deque
 from dataclasses import dataclass
+from functools import partial
+from typing import Literal
 
 from .models import Action, MarketState, Portfolio, Position, TradingDecision
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeExecution:
     """Result of a trade execution."""
     success: bool
@@ -33,6 +36,17 @@ class PortfolioManager:
     when markets resolve.
     """
     
+    __slots__ = (
+        "initial_bankroll",
+        "max_position_pct",
+        "portfolios",
+        "recent_decisions",
+        "_summary_cache",
+        "_dirty",
+        "_holders",
+        "_handlers",
+    )
+    
     def __init__(
         self,
         model_ids: list[str],
@@ -51,9 +65,10 @@ class PortfolioManager:
         self.initial_bankroll = initial_bankroll
         self.max_position_pct = max_position_pct
         
-        # Initialize portfolios for each model
+        # Initialize portfolios for each model (ids are interned so lookups
+        # with the engine's interned ids compare by identity)
         self.portfolios: dict[str, Portfolio] = {}
-        for model_id in model_ids:
+        for model_id in map(sys.intern, model_ids):
             self.portfolios[model_id] = Portfolio(
                 model_id=model_id,
                 model_name=model_names.get(model_id, model_id),
@@ -61,11 +76,28 @@ class PortfolioManager:
                 initial_bankroll=initial_bankroll,
                 positions={},
                 pnl_history=[],
-                decisions=[],
                 total_trades=0,
                 winning_trades=0,
             )
         
+        # Cached get_summary() entries and the models whose entry is stale
+        self._summary_cache: dict[str, dict] = {}
+        self._dirty: set[str] = set(self.portfolios)
+        
+        # Most recent decisions across all portfolios, for status reporting
+        self.recent_decisions: deque[TradingDecision] = deque(maxlen=100)
+        
+        # Reverse index of market_ticker -> model_ids holding a position
+        self._holders: dict[str, set[str]] = {}
+        
+        # Trade handlers keyed by action (HOLD has no handler)
+        self._handlers = {
+            Action.BUY_YES: partial(self._buy, side="yes"),
+            Action.BUY_NO: partial(self._buy, side="no"),
+            Action.SELL_YES: self._sell,
+            Action.SELL_NO: self._sell,
+        }
+        
         logger.info(
             f"PortfolioManager initialized for {len(model_ids)} models",
             extra={"initial_bankroll": initial_bankroll},
@@ -79,63 +111,73 @@ class PortfolioManager:
         """Get all portfolios."""
         return list(self.portfolios.values())
     
-    def _calculate_max_quantity(
+    def execute_decision(
         self,
-        portfolio: Portfolio,
-        price: float,
-    ) -> int:
-        """Calculate maximum contracts that can be purchased.
+        decision: TradingDecision,
+        state: MarketState,
+    ) -> TradeExecution:
+        """Execute a trading decision.
         
         Args:
-            portfolio: The portfolio to check
-            price: Price per contract in cents
+            decision: The trading decision to execute
+            state: Current market state with prices
             
         Returns:
-            Maximum number of contracts affordable
+            TradeExecution result
         """
-        if price <= 0:
-            return 0
-        
-        # Max position size
-        max_position_value = portfolio.bankroll * self.max_position_pct
-        
-        # How many contracts at this price
-        max_quantity = int(max_position_value / price)
-        
-        return max(0, max_quantity)
+        return self._execute(decision, self._quote_prices(state))
     
-    def execute_decision(
+    def execute_decisions(
         self,
-        decision: TradingDecision,
+        decisions: list[TradingDecision],
         state: MarketState,
-    ) -> TradeExecution:
-        """Execute a trading decision.
+    ) -> list[TradeExecution]:
+        """Execute a batch of decisions made against the same market state.
+        
+        Quote prices are derived from the state once for the whole batch
+        rather than once per decision.
         
         Args:
-            decision: The trading decision to execute
+            decisions: Trading decisions to execute, in order
             state: Current market state with prices
             
         Returns:
-            TradeExecution result
+            TradeExecution results in the same order as decisions
         """
+        prices = self._quote_prices(state)
+        return [self._execute(decision, prices) for decision in decisions]
+    
+    @classmethod
+    def _quote_prices(cls, state: MarketState) -> dict[Action, float]:
+        """Get the valid execution price for each trading action."""
+        yes_bid = state.current_yes_bid
+        yes_ask = state.current_yes_ask
+        return {
+            Action.BUY_YES: cls._clamp_price(yes_ask),  # Pay ask price
+            Action.BUY_NO: cls._clamp_price(100 - yes_bid),  # NO price is 100 - YES bid
+            Action.SELL_YES: cls._clamp_price(yes_bid),
+            Action.SELL_NO: cls._clamp_price(100 - yes_ask),
+        }
+    
+    def _execute(
+        self,
+        decision: TradingDecision,
+        prices: dict[Action, float],
+    ) -> TradeExecution:
+        """Execute a decision at precomputed quote prices."""
         portfolio = self.portfolios.get(decision.model_id)
         if not portfolio:
-            return TradeExecution(
-                success=False,
-                model_id=decision.model_id,
-                market_ticker=decision.market_ticker,
-                action=decision.action,
-                quantity=0,
-                price=0,
-                cost=0,
-                error="Portfolio not found",
-            )
+            return self._fail(decision, "Portfolio not found")
         
         # Record the decision
         portfolio.decisions.append(decision)
+        portfolio.total_decisions += 1
+        self.recent_decisions.append(decision)
+        
+        handler = self._handlers.get(decision.action)
         
         # Handle HOLD - no trade execution
-        if decision.action == Action.HOLD:
+        if handler is None:
             return TradeExecution(
                 success=True,
                 model_id=decision.model_id,
@@ -146,139 +188,126 @@ class PortfolioManager:
                 cost=0,
             )
         
-        # Determine price based on action
-        if decision.action == Action.BUY_YES:
-            price = state.current_yes_ask  # Pay ask price
-        elif decision.action == Action.BUY_NO:
-            price = 100 - state.current_yes_bid  # NO price is 100 - YES bid
-        elif decision.action in (Action.SELL_YES, Action.SELL_NO):
-            # Check if we have a position to sell
-            if decision.market_ticker not in portfolio.positions:
-                return TradeExecution(
-                    success=False,
-                    model_id=decision.model_id,
-                    market_ticker=decision.market_ticker,
-                    action=decision.action,
-                    quantity=0,
-                    price=0,
-                    cost=0,
-                    error="No position to sell",
-                )
-            price = state.current_yes_bid if decision.action == Action.SELL_YES else (100 - state.current_yes_ask)
-        else:
-            price = 50  # Fallback
-        
-        # Ensure price is valid
-        if price <= 0:
-            price = 1
-        if price > 100:
-            price = 99
-        
-        # Calculate quantity
-        requested_quantity = decision.quantity
-        if decision.action in (Action.BUY_YES, Action.BUY_NO):
-            max_quantity = self._calculate_max_quantity(portfolio, price)
-            quantity = min(requested_quantity, max_quantity)
-            
-            if quantity <= 0:
-                return TradeExecution(
-                    success=False,
-                    model_id=decision.model_id,
-                    market_ticker=decision.market_ticker,
-                    action=decision.action,
-                    quantity=0,
-                    price=price,
-                    cost=0,
-                    error="Insufficient bankroll",
-                )
+        self._dirty.add(portfolio.model_id)
+        return handler(portfolio, decision, prices[decision.action])
+    
+    def _buy(
+        self,
+        portfolio: Portfolio,
+        decision: TradingDecision,
+        price: float,
+        side: Literal["yes", "no"],
+    ) -> TradeExecution:
+        """Buy contracts on one side at that side's ask price."""
+        # Cap the position at max_position_pct of bankroll (price is
+        # always >= 1 after clamping)
+        max_quantity = int(portfolio.bankroll * self.max_position_pct / price)
+        quantity = min(decision.quantity, max_quantity)
+        if quantity <= 0:
+            return self._fail(decision, "Insufficient bankroll", price)
+        
+        cost = quantity * price
+        portfolio.bankroll -= cost
+        
+        # Add to an existing same-side position, otherwise open a new one
+        # (replacing any opposite-side position)
+        ticker = decision.market_ticker
+        positions = portfolio.positions
+        pos = positions.get(ticker)
+        if pos is not None and pos.side == side:
+            total_cost = pos.avg_price * pos.quantity + cost
+            pos.quantity += quantity
+            pos.avg_price = total_cost / pos.quantity
         else:
-            # Selling - use position quantity
-            position = portfolio.positions.get(decision.market_ticker)
-            if position:
-                quantity = min(requested_quantity, position.quantity)
-            else:
-                quantity = 0
-        
-        # Execute trade
+            if pos is not None:
+                portfolio.positions_stake -= pos.quantity * 50
+            positions[ticker] = Position(
+                market_ticker=ticker,
+                side=side,
+                quantity=quantity,
+                avg_price=price,
+                entry_timestamp=decision.timestamp,
+            )
+            self._holders.setdefault(ticker, set()).add(portfolio.model_id)
+        portfolio.positions_stake += quantity * 50
+        portfolio.total_trades += 1
+        
+        return self._executed(decision, quantity, price, cost)
+    
+    def _sell(
+        self,
+        portfolio: Portfolio,
+        decision: TradingDecision,
+        price: float,
+    ) -> TradeExecution:
+        """Sell (part of) an existing position at the bid price."""
+        # Check if we have a position to sell
+        ticker = decision.market_ticker
+        positions = portfolio.positions
+        position = positions.get(ticker)
+        if position is None:
+            return self._fail(decision, "No position to sell")
+        
+        quantity = min(decision.quantity, position.quantity)
         cost = quantity * price
         
-        if decision.action == Action.BUY_YES:
-            portfolio.bankroll -= cost
+        if quantity > 0:
+            portfolio.bankroll += cost
             
-            # Update or create position
-            if decision.market_ticker in portfolio.positions:
-                pos = portfolio.positions[decision.market_ticker]
-                if pos.side == "yes":
-                    # Add to existing YES position
-                    total_cost = pos.avg_price * pos.quantity + cost
-                    pos.quantity += quantity
-                    pos.avg_price = total_cost / pos.quantity
-                else:
-                    # Close NO position and open YES
-                    portfolio.positions[decision.market_ticker] = Position(
-                        market_ticker=decision.market_ticker,
-                        side="yes",
-                        quantity=quantity,
-                        avg_price=price,
-                        entry_timestamp=decision.timestamp,
-                    )
-            else:
-                portfolio.positions[decision.market_ticker] = Position(
-                    market_ticker=decision.market_ticker,
-                    side="yes",
-                    quantity=quantity,
-                    avg_price=price,
-                    entry_timestamp=decision.timestamp,
-                )
-            portfolio.total_trades += 1
+            # Check if profitable
+            pnl = quantity * (price - position.avg_price)
+            portfolio.realized_pnl += pnl
+            if pnl > 0:
+                portfolio.winning_trades += 1
             
-        elif decision.action == Action.BUY_NO:
-            portfolio.bankroll -= cost
+            position.quantity -= quantity
+            portfolio.positions_stake -= quantity * 50
+            if position.quantity <= 0:
+                del positions[ticker]
+                self._holders[ticker].discard(portfolio.model_id)
             
-            if decision.market_ticker in portfolio.positions:
-                pos = portfolio.positions[decision.market_ticker]
-                if pos.side == "no":
-                    total_cost = pos.avg_price * pos.quantity + cost
-                    pos.quantity += quantity
-                    pos.avg_price = total_cost / pos.quantity
-                else:
-                    portfolio.positions[decision.market_ticker] = Position(
-                        market_ticker=decision.market_ticker,
-                        side="no",
-                        quantity=quantity,
-                        avg_price=price,
-                        entry_timestamp=decision.timestamp,
-                    )
-            else:
-                portfolio.positions[decision.market_ticker] = Position(
-                    market_ticker=decision.market_ticker,
-                    side="no",
-                    quantity=quantity,
-                    avg_price=price,
-                    entry_timestamp=decision.timestamp,
-                )
             portfolio.total_trades += 1
-            
-        elif decision.action in (Action.SELL_YES, Action.SELL_NO):
-            # Sell position
-            position = portfolio.positions.get(decision.market_ticker)
-            if position and quantity > 0:
-                proceeds = quantity * price
-                portfolio.bankroll += proceeds
-                
-                # Check if profitable
-                if price > position.avg_price:
-                    portfolio.winning_trades += 1
-                
-                position.quantity -= quantity
-                if position.quantity <= 0:
-                    del portfolio.positions[decision.market_ticker]
-                
-                portfolio.total_trades += 1
         
+        return self._executed(decision, quantity, price, cost)
+    
+    @staticmethod
+    def _clamp_price(price: float) -> float:
+        """Ensure a contract price is valid."""
+        return 1 if price <= 0 else (99 if price > 100 else price)
+    
+    @staticmethod
+    def _fail(
+        decision: TradingDecision,
+        error: str,
+        price: float = 0,
+    ) -> TradeExecution:
+        """Result for a decision that could not be executed."""
+        return TradeExecution(
+            False,
+            decision.model_id,
+            decision.market_ticker,
+            decision.action,
+            0,
+            price,
+            0,
+            error,
+        )
+    
+    @staticmethod
+    def _executed(
+        decision: TradingDecision,
+        quantity: int,
+        price: float,
+        cost: float,
+    ) -> TradeExecution:
+        """Log and return a successful trade execution."""
         logger.debug(
-            f"Trade executed: {decision.model_id} {decision.action.value} "
-            f"{quantity} @ {price}¢ on {decision.market_ticker}",
+            "Trade executed: %s %s %d @ %s¢ on %s",
+            decision.model_id,
+            decision.action.value,
+            quantity,
+            price,
+            decision.market_ticker,
             extra={
                 "model": decision.model_id,
                 "action": decision.action.value,
@@ -312,42 +341,43 @@ class PortfolioManager:
         Returns:
             Dict of model_id -> P&L from this market
         """
-        pnl_by_model: dict[str, float] = {}
+        pnl_by_model: dict[str, float] = dict.fromkeys(self.portfolios, 0)
         
-        for model_id, portfolio in self.portfolios.items():
-            if market_ticker not in portfolio.positions:
-                pnl_by_model[model_id] = 0
-                continue
-            
-            position = portfolio.positions[market_ticker]
+        # Winning contracts pay 100¢, losing pay 0¢
+        winning_side = "yes" if result == "yes" else "no"
+        
+        # Only visit the models actually holding this market
+        for model_id in self._holders.pop(market_ticker, ()):
+            portfolio = self.portfolios[model_id]
+            position = portfolio.positions.pop(market_ticker)
             
-            # Calculate settlement value
-            # Winning contracts pay 100¢, losing pay 0¢
-            if result == "yes":
-                settlement_value = 100 if position.side == "yes" else 0
-            else:
-                settlement_value = 100 if position.side == "no" else 0
+            self._dirty.add(model_id)
             
             # Calculate P&L
+            settlement_value = 100 if position.side == winning_side else 0
             proceeds = position.quantity * settlement_value
             cost_basis = position.quantity * position.avg_price
             pnl = proceeds - cost_basis
             
             # Update bankroll
             portfolio.bankroll += proceeds
+            portfolio.positions_stake -= position.quantity * 50
+            portfolio.realized_pnl += pnl
             
             # Track winning trades
             if pnl > 0:
                 portfolio.winning_trades += 1
             
-            # Remove position
-            del portfolio.positions[market_ticker]
-            
             pnl_by_model[model_id] = pnl
             
             logger.info(
-                f"Settled {market_ticker} for {model_id}: "
-                f"{position.quantity} {position.side} -> {result}, P&L: {pnl}¢",
+                "Settled %s for %s: %d %s -> %s, P&L: %s¢",
+                market_ticker,
+                model_id,
+                position.quantity,
+                position.side,
+                result,
+                pnl,
                 extra={
                     "model": model_id,
                     "market": market_ticker,
@@ -358,6 +388,40 @@ class PortfolioManager:
         
         return pnl_by_model
     
+    def restore_portfolio(self, model_id: str, state: dict) -> None:
+        """Restore a portfolio from a checkpoint taken after a settlement.
+        
+        Positions are not restored: every position in a market is settled
+        before its checkpoint is written.
+        
+        Args:
+            model_id: The model whose portfolio to restore
+            state: Checkpointed bankroll and counters, plus the P&L
+                snapshots recorded since the previous checkpoint
+        """
+        portfolio = self.portfolios.get(model_id)
+        if portfolio is None:
+            return
+        
+        portfolio.bankroll = state["bankroll"]
+        portfolio.realized_pnl = state["realized_pnl"]
+        portfolio.total_decisions = state["total_decisions"]
+        portfolio.total_trades = state["total_trades"]
+        portfolio.winning_trades = state["winning_trades"]
+        portfolio.pnl_history.extend(state["pnl_history"])
+        self._dirty.add(model_id)
+    
+    def restore_decisions(self, decisions: list[TradingDecision]) -> None:
+        """Re-append checkpointed decisions to the decision histories.
+        
+        Counters are not touched; they are restored by restore_portfolio().
+        """
+        for decision in decisions:
+            portfolio = self.portfolios.get(decision.model_id)
+            if portfolio is not None:
+                portfolio.decisions.append(decision)
+            self.recent_decisions.append(decision)
+    
     def record_snapshot(self, timestamp: int) -> None:
         """Record a P&L snapshot for all portfolios.
         
@@ -365,11 +429,9 @@ class PortfolioManager:
             timestamp: Current simulation timestamp
         """
         for portfolio in self.portfolios.values():
-            # Calculate unrealized P&L (simplified - would need current prices)
-            total_value = portfolio.bankroll
-            for pos in portfolio.positions.values():
-                # Estimate position value at 50¢ (neutral)
-                total_value += pos.quantity * 50
+            # Calculate unrealized P&L (simplified - would need current prices),
+            # using the running 50¢-per-contract value of open positions
+            total_value = portfolio.bankroll + portfolio.positions_stake
             
             portfolio.pnl_history.append({
                 "timestamp": timestamp,
@@ -379,9 +441,13 @@ class PortfolioManager:
             })
     
     def get_summary(self) -> dict[str, dict]:
-        """Get a summary of all portfolios."""
-        summary = {}
-        for model_id, portfolio in self.portfolios.items():
+        """Get a summary of all portfolios.
+        
+        Per-model entries are cached and only recomputed for portfolios
+        that traded or settled since the previous call.
+        """
+        for model_id in self._dirty:
+            portfolio = self.portfolios[model_id]
             roi = (portfolio.bankroll - portfolio.initial_bankroll) / portfolio.initial_bankroll
             win_rate = (
                 portfolio.winning_trades / portfolio.total_trades
@@ -389,7 +455,7 @@ class PortfolioManager:
                 else 0
             )
             
-            summary[model_id] = {
+            self._summary_cache[model_id] = {
                 "model_name": portfolio.model_name,
                 "bankroll": portfolio.bankroll,
                 "initial_bankroll": portfolio.initial_bankroll,
@@ -397,8 +463,9 @@ class PortfolioManager:
                 "total_trades": portfolio.total_trades,
                 "winning_trades": portfolio.winning_trades,
                 "win_rate": win_rate,
+                "realized_pnl": portfolio.realized_pnl,
                 "open_positions": len(portfolio.positions),
             }
+        self._dirty.clear()
         
-        return summary
-
+        return dict(self._summary_cache)
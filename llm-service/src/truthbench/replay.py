@@ -7,19 +7,36 @@ market conditions.
 
 import json
 import logging
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from itertools import accumulate
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .models import Candlestick, MarketState, SimulationConfig
+from .models import Candlestick, MarketState, PriceHistory, SimulationConfig
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON decoder
+    orjson = None
+
+# Both decoders accept UTF-8 bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
+# Stand-in for a missing nested OHLC dict in Kalshi API candlesticks
+_NO_OHLC: dict = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class ResolvedMarket:
-    """A resolved market loaded from JSON."""
+    """A resolved market loaded from JSON.
+    
+    ``price_history`` is parsed into columns once at load time; the raw
+    candlestick dicts are not kept. ``cum_volume[i]`` is the total volume
+    traded up to and including candlestick ``i``.
+    """
     ticker: str
     event_ticker: str
     series_ticker: str
@@ -38,7 +55,11 @@ class ResolvedMarket:
     close_time: str
     expiration_time: str
     result: str
-    price_history: list[dict]
+    price_history: PriceHistory
+    cum_volume: list[int] = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self.cum_volume = list(accumulate(self.price_history.volume))
 
 
 class MarketReplayEngine:
@@ -57,6 +78,7 @@ class MarketReplayEngine:
         """
         self.config = config
         self.markets: list[ResolvedMarket] = []
+        self._by_ticker: dict[str, ResolvedMarket] = {}
         self.current_market_idx: int = 0
         self.current_candlestick_idx: int = 0
         self._loaded = False
@@ -69,6 +91,12 @@ class MarketReplayEngine:
     def load_markets(self, base_path: Path | None = None) -> int:
         """Load markets from the JSON file.
         
+        Accepts either a JSON document of the form ``{"markets": [...]}``
+        or, for files ending in ``.jsonl``, one market object per line.
+        JSON Lines files are decoded one market at a time, so rejected
+        markets are never all held in memory and reading stops once
+        ``max_markets`` have been accepted.
+        
         Args:
             base_path: Base path to look for the markets file
             
@@ -86,25 +114,25 @@ class MarketReplayEngine:
         
         logger.info(f"Loading markets from {markets_path}")
         
-        with open(markets_path, "r") as f:
-            data = json.load(f)
-        
-        raw_markets = data.get("markets", [])
+        total_raw = 0
         
         # Filter and convert markets
-        for raw in raw_markets:
+        for raw in self._iter_raw_markets(markets_path):
+            total_raw += 1
+            
             # Skip markets with insufficient volume
             if raw.get("volume", 0) < self.config.min_volume:
                 continue
             
-            # Skip markets without price history
-            if not raw.get("price_history"):
-                continue
-            
             # Skip markets without a result
             if not raw.get("result"):
                 continue
             
+            # Skip markets without price history
+            if not raw.get("price_history"):
+                continue
+            
+            raw_history = raw["price_history"]
             market = ResolvedMarket(
                 ticker=raw.get("ticker", ""),
                 event_ticker=raw.get("event_ticker", ""),
@@ -124,7 +152,9 @@ class MarketReplayEngine:
                 close_time=raw.get("close_time", ""),
                 expiration_time=raw.get("expiration_time", ""),
                 result=raw.get("result", ""),
-                price_history=raw.get("price_history", []),
+                price_history=PriceHistory.from_candlesticks(
+                    map(self._candlestick_parser(raw_history), raw_history)
+                ),
             )
             self.markets.append(market)
             
@@ -132,43 +162,84 @@ class MarketReplayEngine:
             if self.config.max_markets and len(self.markets) >= self.config.max_markets:
                 break
         
+        # Built in reverse so the first market wins on duplicate tickers
+        self._by_ticker = {m.ticker: m for m in reversed(self.markets)}
         self._loaded = True
         
         logger.info(
             f"Loaded {len(self.markets)} markets",
             extra={
-                "total_raw": len(raw_markets),
-                "filtered": len(raw_markets) - len(self.markets),
+                "total_raw": total_raw,
+                "filtered": total_raw - len(self.markets),
             }
         )
         
         return len(self.markets)
     
+    @staticmethod
+    def _iter_raw_markets(markets_path: Path) -> Iterator[dict]:
+        """Yield raw market dicts from a JSON or JSON Lines markets file."""
+        with open(markets_path, "rb") as f:
+            if markets_path.suffix == ".jsonl":
+                for line in f:
+                    if line.strip():
+                        yield _json_loads(line)
+                return
+            
+            data = _json_loads(f.read())
+        
+        yield from data.get("markets", [])
+    
     def get_total_markets(self) -> int:
         """Get total number of markets."""
         return len(self.markets)
     
     def get_market_by_ticker(self, ticker: str) -> ResolvedMarket | None:
         """Get a specific market by ticker."""
-        for market in self.markets:
-            if market.ticker == ticker:
-                return market
-        return None
+        return self._by_ticker.get(ticker)
     
-    def _parse_candlestick(self, raw: dict) -> Candlestick:
-        """Parse a raw candlestick dict into a Candlestick object."""
-        # Handle nested price structure from Kalshi API
-        price_data = raw.get("price", {})
-        yes_bid_data = raw.get("yes_bid", {})
-        yes_ask_data = raw.get("yes_ask", {})
+    @staticmethod
+    def _candlestick_parser(raw_history: list[dict]) -> Callable[[dict], Candlestick]:
+        """Pick the candlestick parser matching a market's history format.
         
+        Histories exported by ``kalshi.extract_resolved`` are flat and get
+        a fast parser. Candlesticks straight from the Kalshi API nest OHLC
+        dicts and are parsed field by field. The format is detected once
+        from the first candlestick.
+        """
+        first = raw_history[0]
+        if isinstance(first.get("price"), dict) or isinstance(first.get("yes_bid"), dict):
+            return MarketReplayEngine._parse_candlestick
+        return MarketReplayEngine._parse_flat_candlestick
+    
+    @staticmethod
+    def _parse_candlestick(raw: dict) -> Candlestick:
+        """Parse a candlestick in either format, looking up each field in both."""
         return Candlestick(
             timestamp=raw.get("timestamp", raw.get("end_period_ts", 0)),
-            yes_bid=yes_bid_data.get("close", raw.get("yes_bid_close", 0)) or 0,
-            yes_ask=yes_ask_data.get("close", raw.get("yes_ask_close", 0)) or 0,
-            price_close=price_data.get("close", raw.get("price_close", 0)) or 0,
-            volume=raw.get("volume", 0) or 0,
-            open_interest=raw.get("open_interest", 0) or 0,
+            yes_bid=raw.get("yes_bid", _NO_OHLC).get("close", raw.get("yes_bid_close", 0)) or 0,
+            yes_ask=raw.get("yes_ask", _NO_OHLC).get("close", raw.get("yes_ask_close", 0)) or 0,
+            price_close=raw.get("price", _NO_OHLC).get("close", raw.get("price_close", 0)) or 0,
+            volume=raw.get("volume") or 0,
+            open_interest=raw.get("open_interest") or 0,
+        )
+    
+    @staticmethod
+    def _parse_flat_candlestick(raw: dict) -> Candlestick:
+        """Parse a flat (exported) candlestick dict.
+        
+        Candlesticks that are not flat (no ``timestamp``, or nested price
+        keys) fall back to _parse_candlestick instead of parsing as zeros.
+        """
+        if "timestamp" not in raw or "price" in raw or "yes_bid" in raw or "yes_ask" in raw:
+            return MarketReplayEngine._parse_candlestick(raw)
+        return Candlestick(
+            timestamp=raw["timestamp"],
+            yes_bid=raw.get("yes_bid_close") or 0,
+            yes_ask=raw.get("yes_ask_close") or 0,
+            price_close=raw.get("price_close") or 0,
+            volume=raw.get("volume") or 0,
+            open_interest=raw.get("open_interest") or 0,
         )
     
     def get_market_state_at_timestep(
@@ -186,11 +257,10 @@ class MarketReplayEngine:
             MarketState visible at that timestep
         """
         # Get candlesticks up to and including this timestep
-        history_up_to_now = market.price_history[:timestep_idx + 1]
-        candlesticks = [self._parse_candlestick(c) for c in history_up_to_now]
+        history = market.price_history.prefix(timestep_idx + 1)
         
         # Current candlestick
-        current = candlesticks[-1] if candlesticks else None
+        current = history[-1] if history else None
         
         return MarketState(
             ticker=market.ticker,
@@ -203,10 +273,11 @@ class MarketReplayEngine:
             current_yes_bid=current.yes_bid if current else 50,
             current_yes_ask=current.yes_ask if current else 50,
             current_price=current.price_close if current else 50,
-            volume=sum(c.volume for c in candlesticks),
+            volume=market.cum_volume[len(history) - 1] if history else 0,
             open_interest=current.open_interest if current else 0,
-            price_history=candlesticks,
+            price_history=history,
             result=market.result,  # Hidden from LLMs during prompting
+            price_range=history.price_range(),
         )
     
     def iterate_market_timesteps(
@@ -275,12 +346,9 @@ class MarketReplayEngine:
                 for i in range(total)
             ]
         
-        # Calculate indices for evenly spaced points
-        # Always include first and last
-        indices = [0]
+        # Evenly spaced indices, always including first and last
         step = (total - 1) / (num_points - 1)
-        for i in range(1, num_points - 1):
-            indices.append(int(i * step))
+        indices = [int(i * step) for i in range(num_points - 1)]
         indices.append(total - 1)
         
         return [
@@ -8,16 +8,32 @@ This module calculates benchmark metrics for evaluating LLM performance:
 - Win Rate (profitable trade percentage)
 """
 
+import io
+import json
 import logging
 import math
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import pairwise
+from operator import attrgetter
+from statistics import fmean
 
 from .models import Action, ModelScore, Portfolio, TradingDecision
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Returns are hourly; annualize over ~8760 hours/year
+_HOURS_PER_YEAR = 8760
+_SQRT_HOURS_PER_YEAR = math.sqrt(_HOURS_PER_YEAR)
+
 
-@dataclass
+@dataclass(slots=True)
 class MarketPrediction:
     """A prediction made by an LLM for a specific market."""
     model_id: str
@@ -36,9 +52,42 @@ class ScoringEngine:
     
     def __init__(self):
         """Initialize the scoring engine."""
-        self.predictions: list[MarketPrediction] = []
+        # Directional predictions stored column-wise, one entry per
+        # prediction in recording order (outcome 1 = yes)
+        self._model_ids: list[str] = []
+        self._tickers: list[str] = []
+        self._timestamps = array("q")
+        self._probs = array("d")
+        self._outcomes = array("B")
+        # Per-model (brier_score, accuracy), cleared when a prediction is
+        # recorded
+        self._metrics_by_model: dict[str, tuple[float, float]] | None = None
         logger.info("ScoringEngine initialized")
     
+    @property
+    def predictions(self) -> tuple[MarketPrediction, ...]:
+        """All recorded predictions, in recording order.
+        
+        Built from the stored columns on each access, so it is read-only;
+        use record_prediction() to add one.
+        """
+        return tuple(
+            MarketPrediction(
+                model_id=model_id,
+                market_ticker=ticker,
+                probability_yes=prob,
+                actual_result="yes" if outcome else "no",
+                timestamp=timestamp,
+            )
+            for model_id, ticker, prob, outcome, timestamp in zip(
+                self._model_ids,
+                self._tickers,
+                self._probs,
+                self._outcomes,
+                self._timestamps,
+            )
+        )
+    
     def record_prediction(
         self,
         decision: TradingDecision,
@@ -52,13 +101,12 @@ class ScoringEngine:
         """
         # Only record if the LLM made a directional bet
         if decision.action in (Action.BUY_YES, Action.BUY_NO):
-            self.predictions.append(MarketPrediction(
-                model_id=decision.model_id,
-                market_ticker=decision.market_ticker,
-                probability_yes=decision.probability_yes,
-                actual_result=actual_result,
-                timestamp=decision.timestamp,
-            ))
+            self._model_ids.append(decision.model_id)
+            self._tickers.append(decision.market_ticker)
+            self._timestamps.append(decision.timestamp)
+            self._probs.append(decision.probability_yes)
+            self._outcomes.append(actual_result == "yes")
+            self._metrics_by_model = None
     
     def calculate_brier_score(self, model_id: str) -> float:
         """Calculate Brier score for a model.
@@ -74,21 +122,7 @@ class ScoringEngine:
         Returns:
             Brier score (0-1, lower is better)
         """
-        model_predictions = [
-            p for p in self.predictions
-            if p.model_id == model_id
-        ]
-        
-        if not model_predictions:
-            return 0.25  # Random baseline
-        
-        total_squared_error = 0.0
-        for pred in model_predictions:
-            outcome = 1.0 if pred.actual_result == "yes" else 0.0
-            error = pred.probability_yes - outcome
-            total_squared_error += error ** 2
-        
-        return total_squared_error / len(model_predictions)
+        return self._brier_and_accuracy(model_id)[0]
     
     def calculate_accuracy(self, model_id: str) -> float:
         """Calculate directional accuracy for a model.
@@ -102,22 +136,48 @@ class ScoringEngine:
         Returns:
             Accuracy (0-1, higher is better)
         """
-        model_predictions = [
-            p for p in self.predictions
-            if p.model_id == model_id
-        ]
+        return self._brier_and_accuracy(model_id)[1]
+    
+    def _brier_and_accuracy(self, model_id: str) -> tuple[float, float]:
+        """Calculate Brier score and accuracy for one model.
         
-        if not model_predictions:
-            return 0.5  # Random baseline
+        Args:
+            model_id: The model to score
+            
+        Returns:
+            (brier_score, accuracy), or the random baselines (0.25, 0.5)
+            when the model made no directional predictions
+        """
+        return self._brier_and_accuracy_by_model().get(model_id, (0.25, 0.5))
+    
+    def _brier_and_accuracy_by_model(self) -> dict[str, tuple[float, float]]:
+        """Calculate Brier score and accuracy for every model in one pass.
         
-        correct = 0
-        for pred in model_predictions:
-            predicted_yes = pred.probability_yes >= 0.5
-            actual_yes = pred.actual_result == "yes"
-            if predicted_yes == actual_yes:
-                correct += 1
+        The result is cached until the next prediction is recorded, so
+        scoring models one at a time sweeps the predictions only once.
         
-        return correct / len(model_predictions)
+        Returns:
+            Dict of model_id -> (brier_score, accuracy) for each model with
+            at least one directional prediction
+        """
+        if self._metrics_by_model is not None:
+            return self._metrics_by_model
+        
+        squared_errors: defaultdict[str, float] = defaultdict(float)
+        correct: defaultdict[str, int] = defaultdict(int)
+        counts: defaultdict[str, int] = defaultdict(int)
+        
+        for model_id, prob, outcome in zip(self._model_ids, self._probs, self._outcomes):
+            error = prob - outcome
+            squared_errors[model_id] += error * error
+            correct[model_id] += (prob >= 0.5) == outcome
+            counts[model_id] += 1
+        
+        self._metrics_by_model = {
+            model_id: (squared_errors[model_id] / count, correct[model_id] / count)
+            for model_id, count in counts.items()
+        }
+        return self._metrics_by_model
     
     def calculate_roi(self, portfolio: Portfolio) -> float:
         """Calculate Return on Investment.
@@ -160,33 +220,27 @@ class ScoringEngine:
             return 0.0
         
         # Calculate period returns
-        returns = []
-        for i in range(1, len(portfolio.pnl_history)):
-            prev_value = portfolio.pnl_history[i-1].get("total_value", portfolio.initial_bankroll)
-            curr_value = portfolio.pnl_history[i].get("total_value", portfolio.initial_bankroll)
-            
-            if prev_value > 0:
-                period_return = (curr_value - prev_value) / prev_value
-                returns.append(period_return)
-        
-        if not returns:
-            return 0.0
-        
-        # Calculate mean and std dev
-        mean_return = sum(returns) / len(returns)
+        values = [
+            entry.get("total_value", portfolio.initial_bankroll)
+            for entry in portfolio.pnl_history
+        ]
+        returns = [
+            (curr_value - prev_value) / prev_value
+            for prev_value, curr_value in pairwise(values)
+            if prev_value > 0
+        ]
         
         if len(returns) < 2:
             return 0.0
         
+        # Calculate mean and std dev
+        mean_return = fmean(returns)
         variance = sum((r - mean_return) ** 2 for r in returns) / (len(returns) - 1)
         std_dev = math.sqrt(variance) if variance > 0 else 0.001
         
-        # Annualize (assume hourly returns, ~8760 hours/year)
-        annualized_return = mean_return * 8760
-        annualized_std = std_dev * math.sqrt(8760)
-        
-        if annualized_std == 0:
-            return 0.0
+        # Annualize; std_dev is floored above, so the divisor is never 0
+        annualized_return = mean_return * _HOURS_PER_YEAR
+        annualized_std = std_dev * _SQRT_HOURS_PER_YEAR
         
         return (annualized_return - risk_free_rate) / annualized_std
     
@@ -213,13 +267,23 @@ class ScoringEngine:
         Returns:
             ModelScore with all metrics
         """
+        brier_score, accuracy = self._brier_and_accuracy(portfolio.model_id)
+        return self._model_score(portfolio, brier_score, accuracy)
+    
+    def _model_score(
+        self,
+        portfolio: Portfolio,
+        brier_score: float,
+        accuracy: float,
+    ) -> ModelScore:
+        """Build a ModelScore from precomputed prediction metrics."""
         return ModelScore(
             model_id=portfolio.model_id,
             model_name=portfolio.model_name,
             roi=self.calculate_roi(portfolio),
             final_bankroll=portfolio.bankroll,
-            brier_score=self.calculate_brier_score(portfolio.model_id),
-            accuracy=self.calculate_accuracy(portfolio.model_id),
+            brier_score=brier_score,
+            accuracy=accuracy,
             win_rate=self.calculate_win_rate(portfolio),
             total_trades=portfolio.total_trades,
             sharpe_ratio=self.calculate_sharpe_ratio(portfolio),
@@ -237,10 +301,18 @@ class ScoringEngine:
         Returns:
             List of ModelScore sorted by ROI (best first)
         """
-        scores = [self.calculate_model_score(p) for p in portfolios]
+        # One sweep over the predictions covers every model
+        prediction_metrics = self._brier_and_accuracy_by_model()
+        scores = [
+            self._model_score(
+                p,
+                *prediction_metrics.get(p.model_id, (0.25, 0.5)),
+            )
+            for p in portfolios
+        ]
         
         # Sort by ROI descending
-        scores.sort(key=lambda s: s.roi, reverse=True)
+        scores.sort(key=attrgetter("roi"), reverse=True)
         
         return scores
     
@@ -264,29 +336,26 @@ class ScoringEngine:
         Returns:
             Formatted report string
         """
-        lines = [
-            "=" * 60,
-            "TRUTHBENCH RESULTS",
-            "=" * 60,
-            "",
-        ]
+        rule = "=" * 60
+        report = io.StringIO()
+        report.write(f"{rule}\nTRUTHBENCH RESULTS\n{rule}\n\n")
         
         for rank, score in enumerate(scores, 1):
-            lines.extend([
-                f"#{rank} {score.model_name}",
-                f"  ROI: {score.roi:+.2%}",
-                f"  Final Bankroll: ${score.final_bankroll/100:,.2f}",
-                f"  Brier Score: {score.brier_score:.4f}",
-                f"  Accuracy: {score.accuracy:.1%}",
-                f"  Win Rate: {score.win_rate:.1%}",
-                f"  Total Trades: {score.total_trades}",
-                f"  Sharpe Ratio: {score.sharpe_ratio:.2f}",
-                "",
-            ])
-        
-        lines.append("=" * 60)
-        
-        return "\n".join(lines)
+            report.write(
+                f"#{rank} {score.model_name}\n"
+                f"  ROI: {score.roi:+.2%}\n"
+                f"  Final Bankroll: ${score.final_bankroll/100:,.2f}\n"
+                f"  Brier Score: {score.brier_score:.4f}\n"
+                f"  Accuracy: {score.accuracy:.1%}\n"
+                f"  Win Rate: {score.win_rate:.1%}\n"
+                f"  Total Trades: {score.total_trades}\n"
+                f"  Sharpe Ratio: {score.sharpe_ratio:.2f}\n"
+                "\n"
+            )
+        
+        report.write(rule)
+        
+        return report.getvalue()
     
     def to_dict(self, scores: list[ModelScore]) -> list[dict]:
         """Convert scores to list of dicts for JSON serialization."""
@@ -304,4 +373,13 @@ class ScoringEngine:
             }
             for s in scores
         ]
-
+    
+    def to_json(self, scores: list[ModelScore]) -> bytes:
+        """Serialize scores to compact JSON bytes.
+        
+        Uses orjson (which serializes dataclasses natively) when it is
+        installed, skipping the intermediate dicts from to_dict().
+        """
+        if orjson is not None:
+            return orjson.dumps(scores)
+        return json.dumps(self.to_dict(scores), separators=(",", ":")).encode()
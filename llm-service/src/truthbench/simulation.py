@@ -6,16 +6,26 @@ portfolio management, and scoring.
 """
 
 import asyncio
+import json
 import logging
+import os
+import sys
 import time
 import uuid
-from collections.abc import AsyncIterator
-from dataclasses import asdict
+from collections.abc import AsyncIterator, MutableMapping
+from dataclasses import asdict, dataclass
+from itertools import islice
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, BinaryIO, Callable
 
-from .decision import LLMDecisionEngine, SYSTEM_PROMPT, build_market_prompt
+from .decision import (
+    DecisionResult,
+    LLMDecisionEngine,
+    ResponseCache,
+    SYSTEM_PROMPT,
+    build_market_prompt,
+)
 from .models import (
     Action,
     MarketState,
@@ -33,6 +43,67 @@ from .tracing import SimulationTracer
 
 logger = logging.getLogger(__name__)
 
+# Config keys that change a run's results, so a checkpoint may only be
+# resumed by a run that matches on all of them. max_markets is left out so
+# that a run can be resumed with a higher limit.
+_CHECKPOINT_CONFIG_KEYS = (
+    "models",
+    "markets_file",
+    "initial_bankroll",
+    "max_position_pct",
+    "min_volume",
+    "timestep_interval",
+    "snapshot_every_n_decision_points",
+)
+
+# Status broadcasts from the simulation loop are coalesced to at most one
+# per interval (seconds)
+_BROADCAST_INTERVAL = 0.05
+
+
+def _position_summary(portfolio: Portfolio, ticker: str) -> dict | None:
+    """Summarize a portfolio's position in a market, if it holds one."""
+    pos = portfolio.positions.get(ticker)
+    return pos.as_summary() if pos else None
+
+
+def _decision_to_dict(decision: TradingDecision) -> dict:
+    """Convert a TradingDecision to a checkpoint record."""
+    return {
+        "model_id": decision.model_id,
+        "market_ticker": decision.market_ticker,
+        "timestamp": decision.timestamp,
+        "action": decision.action.value,
+        "quantity": decision.quantity,
+        "confidence": decision.confidence,
+        "reasoning": decision.reasoning,
+        "probability_yes": decision.probability_yes,
+    }
+
+
+def _decision_from_dict(data: dict) -> TradingDecision:
+    """Rebuild a TradingDecision from a checkpoint record."""
+    return TradingDecision(
+        model_id=sys.intern(data["model_id"]),
+        market_ticker=sys.intern(data["market_ticker"]),
+        timestamp=data["timestamp"],
+        action=Action(data["action"]),
+        quantity=data["quantity"],
+        confidence=data["confidence"],
+        reasoning=data["reasoning"],
+        probability_yes=data["probability_yes"],
+    )
+
+
+@dataclass(slots=True)
+class ModelCallOutcome:
+    """Result of querying one model at a decision point."""
+    model_id: str
+    portfolio: Portfolio
+    user_prompt: str
+    result: DecisionResult
+    latency_ms: float
+
 
 class TruthBenchSimulation:
     """Main orchestrator for TruthBench benchmark simulations.
@@ -51,6 +122,7 @@ class TruthBenchSimulation:
         config: SimulationConfig,
         llm_client: Any,
         model_names: dict[str, str] | None = None,
+        response_cache: MutableMapping[str, str] | None = None,
     ):
         """Initialize the simulation.
         
@@ -58,6 +130,10 @@ class TruthBenchSimulation:
             config: Simulation configuration
             llm_client: LLM client for making API calls
             model_names: Optional dict mapping model_id -> display name
+            response_cache: Cache of LLM responses to use when
+                config.cache_llm_responses is set, e.g. one shared with
+                earlier runs or a persistent mapping for resumed runs
+                (defaults to a new ResponseCache for this simulation)
         """
         self.simulation_id = str(uuid.uuid4())[:8]
         self.config = config
@@ -69,9 +145,21 @@ class TruthBenchSimulation:
             for model_id in config.models
         }
         
+        # Caps LLM requests in flight across all models
+        self._llm_semaphore = asyncio.Semaphore(config.max_concurrent_llm_calls)
+        
         # Initialize components
         self.replay_engine = MarketReplayEngine(config)
-        self.decision_engine = LLMDecisionEngine(llm_client, rate_limit_delay=1.0)
+        self.decision_engine = LLMDecisionEngine(
+            llm_client,
+            rate_limit_delay=1.0,
+            request_limiter=self._llm_semaphore,
+            response_cache=(
+                (ResponseCache() if response_cache is None else response_cache)
+                if config.cache_llm_responses
+                else None
+            ),
+        )
         self.portfolio_manager = PortfolioManager(
             model_ids=config.models,
             model_names=self.model_names,
@@ -80,37 +168,70 @@ class TruthBenchSimulation:
         )
         self.scoring_engine = ScoringEngine()
         
+        # Portfolios are updated in place, so the list never goes stale
+        self._portfolios = self.portfolio_manager.get_all_portfolios()
+        
         # State tracking
         self._status = "initializing"
         self._current_market: str | None = None
         self._current_timestep: int | None = None
         self._markets_completed = 0
+        self._total_markets = 0
         self._start_time: datetime | None = None
+        self._start_monotonic: float | None = None  # For elapsed time
         self._end_time: datetime | None = None
-        self._recent_decisions: list[TradingDecision] = []
         self._all_decisions: list[TradingDecision] = []
         self._market_results: list[dict] = []
         self._error_message: str | None = None
         self._stop_requested = False
+        self._checkpoint_fp: BinaryIO | None = None
         
         # Callbacks for streaming updates
         self._update_callbacks: list[Callable[[SimulationStatus], None]] = []
         
+        # Pending coalesced broadcast, if one is scheduled
+        self._broadcast_handle: asyncio.TimerHandle | None = None
+        
+        # One wake-up event per active stream_updates() consumer
+        self._status_events: set[asyncio.Event] = set()
+        
+        # Bumped on every broadcast; streamed status dicts are built at most
+        # once per version and shared by all consumers
+        self._status_version = 0
+        self._status_dict_cache: tuple[int, dict] | None = None
+        
+        # Config as reported in traces and results (fixed for the run)
+        self._config_dict = {
+            "models": config.models,
+            "initial_bankroll": config.initial_bankroll,
+            "max_position_pct": config.max_position_pct,
+            "max_markets": config.max_markets,
+            "min_volume": config.min_volume,
+            "timestep_interval": config.timestep_interval,
+            "max_concurrent_llm_calls": config.max_concurrent_llm_calls,
+            "cache_llm_responses": config.cache_llm_responses,
+            "snapshot_every_n_decision_points": config.snapshot_every_n_decision_points,
+            "checkpoint_file": config.checkpoint_file,
+            "stream_trace_records": config.stream_trace_records,
+            "max_trace_records": config.max_trace_records,
+            "compress_traces": config.compress_traces,
+            "trace_raw_on_success": config.trace_raw_on_success,
+        }
+        
         # Initialize tracer for full observability
         self.tracer = SimulationTracer(
             simulation_id=self.simulation_id,
-            config={
-                "models": config.models,
-                "initial_bankroll": config.initial_bankroll,
-                "max_position_pct": config.max_position_pct,
-                "max_markets": config.max_markets,
-                "min_volume": config.min_volume,
-                "timestep_interval": config.timestep_interval,
-            },
+            config=self._config_dict,
+            stream_records=config.stream_trace_records,
+            max_records=config.max_trace_records,
+            compress=config.compress_traces,
+            store_raw_on_success=config.trace_raw_on_success,
         )
+        self._system_prompt_id = self.tracer.register_system_prompt(SYSTEM_PROMPT)
         
         logger.info(
-            f"TruthBenchSimulation {self.simulation_id} initialized",
+            "TruthBenchSimulation %s initialized",
+            self.simulation_id,
             extra={
                 "models": config.models,
                 "initial_bankroll": config.initial_bankroll,
@@ -128,26 +249,51 @@ class TruthBenchSimulation:
         """
         self._update_callbacks.append(callback)
     
-    def _broadcast_status(self) -> None:
-        """Broadcast current status to all callbacks."""
+    def _broadcast_status(self, immediate: bool = False) -> None:
+        """Broadcast current status to all callbacks and streams.
+        
+        Requests are coalesced: the first one schedules a broadcast
+        _BROADCAST_INTERVAL later and any made before it fires are folded
+        into it.
+        
+        Args:
+            immediate: Broadcast now instead, replacing any scheduled
+                broadcast (used for status transitions, which must not be
+                delayed past the end of run())
+        """
+        if immediate:
+            if self._broadcast_handle is not None:
+                self._broadcast_handle.cancel()
+            self._do_broadcast()
+        elif self._broadcast_handle is None:
+            self._broadcast_handle = asyncio.get_running_loop().call_later(
+                _BROADCAST_INTERVAL, self._do_broadcast
+            )
+    
+    def _do_broadcast(self) -> None:
+        """Send the current status to all callbacks and wake all streams."""
+        self._broadcast_handle = None
+        self._status_version += 1
         status = self.get_status()
         for callback in self._update_callbacks:
             try:
                 callback(status)
             except Exception as e:
-                logger.error(f"Error in update callback: {e}")
+                logger.error("Error in update callback: %s", e)
+        
+        for event in self._status_events:
+            event.set()
     
     def get_status(self) -> SimulationStatus:
         """Get current simulation status."""
         elapsed = 0.0
-        if self._start_time:
-            elapsed = (datetime.now(timezone.utc) - self._start_time).total_seconds()
+        if self._start_monotonic is not None:
+            elapsed = time.monotonic() - self._start_monotonic
         
         # Estimate remaining time
         estimated_remaining = None
         if self._markets_completed > 0 and self._status == "running":
-            total_markets = self.replay_engine.get_total_markets()
-            remaining_markets = total_markets - self._markets_completed
+            remaining_markets = self._total_markets - self._markets_completed
             time_per_market = elapsed / self._markets_completed
             estimated_remaining = remaining_markets * time_per_market
         
@@ -157,17 +303,22 @@ class TruthBenchSimulation:
             current_market=self._current_market,
             current_timestep=self._current_timestep,
             markets_completed=self._markets_completed,
-            total_markets=self.replay_engine.get_total_markets(),
-            portfolios=self.portfolio_manager.get_all_portfolios(),
-            recent_decisions=self._recent_decisions[-10:],
+            total_markets=self._total_markets,
+            portfolios=self._portfolios,
+            recent_decisions=self._latest_decisions(10),
             elapsed_time=elapsed,
             estimated_remaining=estimated_remaining,
             error_message=self._error_message,
         )
     
+    def _latest_decisions(self, count: int) -> list[TradingDecision]:
+        """Get the most recent decisions, oldest first."""
+        newest_first = islice(reversed(self.portfolio_manager.recent_decisions), count)
+        return list(newest_first)[::-1]
+    
     def stop(self) -> None:
         """Request the simulation to stop."""
-        logger.info(f"Stop requested for simulation {self.simulation_id}")
+        logger.info("Stop requested for simulation %s", self.simulation_id)
         self._stop_requested = True
     
     async def run(
@@ -185,18 +336,43 @@ class TruthBenchSimulation:
             SimulationResult with final scores
         """
         self._start_time = datetime.now(timezone.utc)
+        self._start_monotonic = time.monotonic()
         self._status = "running"
-        self._broadcast_status()
+        self._broadcast_status(immediate=True)
         
         try:
-            # Load markets
+            # Load markets (off the event loop, so status/stream endpoints
+            # stay responsive while a large file is parsed)
             logger.info("Loading markets...")
-            num_markets = self.replay_engine.load_markets(base_path)
-            logger.info(f"Loaded {num_markets} markets")
+            num_markets = await asyncio.to_thread(
+                self.replay_engine.load_markets, base_path
+            )
+            logger.info("Loaded %d markets", num_markets)
+            self._total_markets = num_markets
             
             if num_markets == 0:
                 raise ValueError("No markets loaded - check file path and filters")
             
+            # Resume markets settled by an earlier, interrupted run
+            completed_tickers = set()
+            if self.config.checkpoint_file:
+                checkpoint_config = {
+                    key: getattr(self.config, key) for key in _CHECKPOINT_CONFIG_KEYS
+                }
+                checkpoint_config["decision_points_per_market"] = decision_points_per_market
+                # File I/O (including fsync) runs off the event loop
+                records = await asyncio.to_thread(
+                    self._open_checkpoint,
+                    Path(self.config.checkpoint_file),
+                    checkpoint_config,
+                )
+                completed_tickers = self._restore_checkpoint(records)
+                logger.info(
+                    "Restored %d markets from checkpoint %s",
+                    len(completed_tickers),
+                    self.config.checkpoint_file,
+                )
+            
             self._broadcast_status()
             
             # Process each market
@@ -206,8 +382,11 @@ class TruthBenchSimulation:
                     self._status = "paused"
                     break
                 
+                if market.ticker in completed_tickers:
+                    continue
+                
                 self._current_market = market.ticker
-                logger.info(f"Processing market: {market.ticker}")
+                logger.info("Processing market: %s", market.ticker)
                 
                 # Get decision points for this market
                 decision_points = self.replay_engine.get_decision_points(
@@ -215,15 +394,26 @@ class TruthBenchSimulation:
                     num_points=decision_points_per_market,
                 )
                 
+                snapshot_every = self.config.snapshot_every_n_decision_points
+                
+                # Where this market's decisions and snapshots start, for
+                # checkpointing
+                decisions_start = len(self._all_decisions)
+                history_start = {p.model_id: len(p.pnl_history) for p in self._portfolios}
+                
+                # Set when a stop request cuts the market short
+                interrupted = False
+                
                 # Query LLMs at each decision point
                 for dp_idx, state in enumerate(decision_points):
                     if self._stop_requested:
+                        interrupted = True
                         break
                     
                     self._current_timestep = state.current_timestamp
                     
                     # Trace market state
-                    prices = [c.price_close for c in state.price_history if c.price_close]
+                    first, last, high, low = state.price_range or (None,) * 4
                     self.tracer.trace_market_state(
                         market_ticker=state.ticker,
                         decision_point_index=dp_idx,
@@ -234,35 +424,53 @@ class TruthBenchSimulation:
                         volume=state.volume,
                         open_interest=state.open_interest,
                         price_history_length=len(state.price_history),
-                        price_at_open=prices[0] if prices else None,
-                        price_at_current=prices[-1] if prices else None,
-                        price_high=max(prices) if prices else None,
-                        price_low=min(prices) if prices else None,
+                        price_at_open=first,
+                        price_at_current=last,
+                        price_high=high,
+                        price_low=low,
                         actual_result=state.result,
                     )
                     
-                    # Get decisions from all models with tracing
-                    for model_id in self.config.models:
-                        portfolio = self.portfolio_manager.get_portfolio(model_id)
-                        if not portfolio:
-                            continue
-                        
-                        # Build prompts for tracing
-                        user_prompt = build_market_prompt(state, portfolio)
-                        
-                        # Time the LLM call
-                        start_time = time.time()
-                        result = await self.decision_engine.get_decision(
-                            model_id, state, portfolio
-                        )
-                        latency_ms = (time.time() - start_time) * 1000
+                    # Query all models concurrently, then apply their
+                    # decisions and trace them in config order
+                    calls = []
+                    async with asyncio.TaskGroup() as tg:
+                        for model_id in self.config.models:
+                            portfolio = self.portfolio_manager.get_portfolio(model_id)
+                            if portfolio:
+                                calls.append(tg.create_task(
+                                    self._query_model(model_id, portfolio, state)
+                                ))
+                    
+                    outcomes = [call.result() for call in calls]
+                    
+                    # Execute all parsed decisions as one batch. Each model
+                    # only trades its own portfolio, so every model's state
+                    # before and after its trade is still traced exactly.
+                    decided = [o for o in outcomes if o.result.success and o.result.decision]
+                    states_before = [
+                        (o.portfolio.bankroll, _position_summary(o.portfolio, state.ticker))
+                        for o in decided
+                    ]
+                    executions = iter(zip(
+                        self.portfolio_manager.execute_decisions(
+                            [o.result.decision for o in decided],
+                            state,
+                        ),
+                        states_before,
+                    ))
+                    
+                    for outcome in outcomes:
+                        model_id = outcome.model_id
+                        portfolio = outcome.portfolio
+                        result = outcome.result
                         
                         # Trace the LLM call
                         self.tracer.trace_llm_call(
                             model_id=model_id,
                             market_ticker=state.ticker,
-                            system_prompt=SYSTEM_PROMPT,
-                            user_prompt=user_prompt,
+                            system_prompt_id=self._system_prompt_id,
+                            user_prompt=outcome.user_prompt,
                             temperature=0.3,
                             max_tokens=500,
                             raw_response=result.raw_response,
@@ -273,39 +481,16 @@ class TruthBenchSimulation:
                             confidence=result.decision.confidence if result.decision else None,
                             probability_yes=result.decision.probability_yes if result.decision else None,
                             reasoning=result.decision.reasoning if result.decision else None,
-                            latency_ms=latency_ms,
+                            latency_ms=outcome.latency_ms,
                         )
                         
                         if result.success and result.decision:
                             decision = result.decision
-                            
-                            # Get portfolio state before trade
-                            bankroll_before = portfolio.bankroll
-                            position_before = None
-                            if state.ticker in portfolio.positions:
-                                pos = portfolio.positions[state.ticker]
-                                position_before = {
-                                    "side": pos.side,
-                                    "quantity": pos.quantity,
-                                    "avg_price": pos.avg_price,
-                                }
-                            
-                            # Execute trade
-                            execution = self.portfolio_manager.execute_decision(
-                                decision,
-                                state,
-                            )
+                            execution, (bankroll_before, position_before) = next(executions)
                             
                             # Get portfolio state after trade
                             bankroll_after = portfolio.bankroll
-                            position_after = None
-                            if state.ticker in portfolio.positions:
-                                pos = portfolio.positions[state.ticker]
-                                position_after = {
-                                    "side": pos.side,
-                                    "quantity": pos.quantity,
-                                    "avg_price": pos.avg_price,
-                                }
+                            position_after = _position_summary(portfolio, state.ticker)
                             
                             # Trace trade execution
                             self.tracer.trace_trade_execution(
@@ -332,12 +517,10 @@ class TruthBenchSimulation:
                             
                             # Track decision
                             self._all_decisions.append(decision)
-                            self._recent_decisions.append(decision)
-                            if len(self._recent_decisions) > 50:
-                                self._recent_decisions = self._recent_decisions[-50:]
                     
                     # Record portfolio snapshot
-                    self.portfolio_manager.record_snapshot(state.current_timestamp)
+                    if snapshot_every and dp_idx % snapshot_every == 0:
+                        self.portfolio_manager.record_snapshot(state.current_timestamp)
                     self._broadcast_status()
                 
                 # Settle the market
@@ -345,6 +528,8 @@ class TruthBenchSimulation:
                     market.ticker,
                     market.result,
                 )
+                if not snapshot_every and decision_points:
+                    self.portfolio_manager.record_snapshot(self._current_timestep)
                 
                 # Trace settlement
                 settlements = [
@@ -358,18 +543,26 @@ class TruthBenchSimulation:
                 )
                 
                 # Record market result
-                self._market_results.append({
+                market_result = {
                     "ticker": market.ticker,
                     "title": market.title,
                     "result": market.result,
                     "pnl_by_model": pnl_by_model,
-                })
+                }
+                self._market_results.append(market_result)
+                
+                # A partially replayed market is left out of the checkpoint,
+                # so a resumed run replays it from the start
+                if self._checkpoint_fp is not None and not interrupted:
+                    record = self._checkpoint_record(
+                        market_result,
+                        self._all_decisions[decisions_start:],
+                        history_start,
+                    )
+                    await asyncio.to_thread(self._write_checkpoint_record, record)
                 
                 self._markets_completed += 1
                 self._broadcast_status()
-                
-                # Small delay between markets
-                await asyncio.sleep(0.1)
             
             # Calculate final scores
             self._status = "completed"
@@ -379,27 +572,32 @@ class TruthBenchSimulation:
             scores = self.scoring_engine.calculate_all_scores(portfolios)
             rankings = self.scoring_engine.get_rankings(scores)
             
-            # Log results
-            report = self.scoring_engine.generate_report(scores)
-            logger.info(f"\n{report}")
+            # Log results (the report is only built when it will be emitted)
+            if logger.isEnabledFor(logging.INFO):
+                report = self.scoring_engine.generate_report(scores)
+                logger.info("\n%s", report)
             
             # Save trace with final results
             self.tracer.set_final_results(
                 scores=self.scoring_engine.to_dict(scores),
                 rankings=rankings,
             )
-            trace_path = self.tracer.save()
-            logger.info(f"Simulation trace saved to {trace_path}")
+            # Write the trace off the event loop; it can be large
+            trace_path = await asyncio.to_thread(self.tracer.save)
+            logger.info("Simulation trace saved to %s", trace_path)
             
             # Log trace summary
-            summary = self.tracer.get_summary()
-            logger.info(
-                f"Trace summary: {summary['total_llm_calls']} LLM calls, "
-                f"${summary['total_cost_usd']:.4f} total cost, "
-                f"{summary['avg_latency_ms']:.0f}ms avg latency"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                summary = self.tracer.get_summary()
+                logger.info(
+                    "Trace summary: %d LLM calls, $%.4f total cost, "
+                    "%.0fms avg latency",
+                    summary["total_llm_calls"],
+                    summary["total_cost_usd"],
+                    summary["avg_latency_ms"],
+                )
             
-            self._broadcast_status()
+            self._broadcast_status(immediate=True)
             
             return SimulationResult(
                 simulation_id=self.simulation_id,
@@ -413,40 +611,221 @@ class TruthBenchSimulation:
             )
             
         except Exception as e:
-            logger.error(f"Simulation error: {e}", exc_info=True)
+            logger.error("Simulation error: %s", e, exc_info=True)
             self._status = "error"
             self._error_message = str(e)
             
             # Save trace even on error
             self.tracer.set_error(str(e))
             try:
-                trace_path = self.tracer.save()
-                logger.info(f"Error trace saved to {trace_path}")
+                trace_path = await asyncio.to_thread(self.tracer.save)
+                logger.info("Error trace saved to %s", trace_path)
             except Exception as save_error:
-                logger.error(f"Failed to save error trace: {save_error}")
+                logger.error("Failed to save error trace: %s", save_error)
             
-            self._broadcast_status()
+            self._broadcast_status(immediate=True)
             raise
+        
+        finally:
+            if self._checkpoint_fp is not None:
+                self._checkpoint_fp.close()
+                self._checkpoint_fp = None
+    
+    def _open_checkpoint(self, path: Path, checkpoint_config: dict) -> list[dict]:
+        """Read a checkpoint file and open it for appending.
+        
+        The first record holds the config of the run that wrote the file;
+        a new file gets this run's config as its first record. A trailing
+        record left incomplete by a crash is truncated away so that new
+        records are appended after the last complete one.
+        
+        Args:
+            path: The checkpoint file (may not exist yet)
+            checkpoint_config: This run's values for the config the
+                checkpoint must have been written with
+            
+        Returns:
+            The settled market records, in the order they were written
+            
+        Raises:
+            ValueError: If the checkpoint was written by a run with a
+                different config
+        """
+        records: list[dict] = []
+        if path.exists():
+            with open(path, "r+b") as f:
+                valid_end = 0
+                while line := f.readline():
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    valid_end = f.tell()
+                    
+                    if valid_end == len(line):
+                        # The header record, written before any market
+                        if record.get("config") != checkpoint_config:
+                            raise ValueError(
+                                f"Checkpoint {path} was written by a run with a "
+                                f"different config: {record.get('config')}"
+                            )
+                    else:
+                        records.append(record)
+                
+                f.truncate(valid_end)
+        
+        self._checkpoint_fp = open(path, "ab")
+        if self._checkpoint_fp.tell() == 0:
+            self._write_checkpoint_record({"config": checkpoint_config})
+        return records
+    
+    def _restore_checkpoint(self, records: list[dict]) -> set[str]:
+        """Replay checkpointed markets into the simulation state.
+        
+        Each record is restored into the portfolios, scoring engine and
+        result lists.
+        
+        Args:
+            records: Settled market records from _open_checkpoint()
+            
+        Returns:
+            Tickers of the restored markets
+        """
+        completed: set[str] = set()
+        for record in records:
+            market_result = record["market"]
+            decisions = [_decision_from_dict(d) for d in record["decisions"]]
+            
+            self.portfolio_manager.restore_decisions(decisions)
+            for model_id, state in record["portfolios"].items():
+                self.portfolio_manager.restore_portfolio(model_id, state)
+            for decision in decisions:
+                self.scoring_engine.record_prediction(
+                    decision,
+                    market_result["result"],
+                )
+            
+            self._all_decisions.extend(decisions)
+            self._market_results.append(market_result)
+            self._markets_completed += 1
+            completed.add(market_result["ticker"])
+        
+        return completed
+    
+    def _checkpoint_record(
+        self,
+        market_result: dict,
+        decisions: list[TradingDecision],
+        history_start: dict[str, int],
+    ) -> dict:
+        """Build the checkpoint record for a settled market.
+        
+        Args:
+            market_result: The market's entry in the market results
+            decisions: Decisions made on the market
+            history_start: Per-model P&L history length before the market
+            
+        Returns:
+            The record; it only references values that are not changed
+            once the market settles, so it can be written from another thread
+        """
+        return {
+            "market": market_result,
+            "decisions": [_decision_to_dict(d) for d in decisions],
+            "portfolios": {
+                p.model_id: {
+                    "bankroll": p.bankroll,
+                    "realized_pnl": p.realized_pnl,
+                    "total_decisions": p.total_decisions,
+                    "total_trades": p.total_trades,
+                    "winning_trades": p.winning_trades,
+                    "pnl_history": p.pnl_history[history_start[p.model_id]:],
+                }
+                for p in self._portfolios
+            },
+        }
+    
+    def _write_checkpoint_record(self, record: dict) -> None:
+        """Append one record to the checkpoint file and sync it to disk."""
+        # One record per market, so syncing each one is cheap
+        fp = self._checkpoint_fp
+        fp.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        fp.flush()
+        os.fsync(fp.fileno())
+    
+    async def _query_model(
+        self,
+        model_id: str,
+        portfolio: Portfolio,
+        state: MarketState,
+    ) -> ModelCallOutcome:
+        """Query one model for a decision, timing the call.
+        
+        Args:
+            model_id: The LLM model to query
+            portfolio: The model's portfolio
+            state: Current market state
+            
+        Returns:
+            ModelCallOutcome with the decision result and latency
+        """
+        # Build the prompt once (before any of this round's trades) and
+        # share it between the request and the trace
+        user_prompt = build_market_prompt(state, portfolio)
+        
+        # Time the LLM call (the engine holds the request limiter only
+        # while the request is in flight)
+        start_time = time.perf_counter()
+        result = await self.decision_engine.get_decision(
+            model_id, state, portfolio, user_prompt
+        )
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        
+        return ModelCallOutcome(
+            model_id=model_id,
+            portfolio=portfolio,
+            user_prompt=user_prompt,
+            result=result,
+            latency_ms=latency_ms,
+        )
     
     async def stream_updates(self) -> AsyncIterator[dict]:
         """Stream simulation updates as they happen.
         
+        Yields the current status immediately, then again each time the
+        simulation broadcasts a change, ending with the final status.
+        
         Yields:
             Dict representation of SimulationStatus
         """
-        last_markets_completed = -1
+        changed = asyncio.Event()
+        changed.set()  # Send the current status straight away
+        self._status_events.add(changed)
         
-        while self._status in ("initializing", "running"):
-            if self._markets_completed != last_markets_completed:
-                last_markets_completed = self._markets_completed
-                status = self.get_status()
-                yield self._status_to_dict(status)
-            
-            await asyncio.sleep(0.5)
+        try:
+            while True:
+                await changed.wait()
+                changed.clear()
+                
+                status = self._current_status_dict()
+                yield status
+                
+                if status["status"] not in ("initializing", "running"):
+                    break
+        finally:
+            self._status_events.discard(changed)
+    
+    def _current_status_dict(self) -> dict:
+        """Get the current status as a dict, reusing it until the next broadcast."""
+        cached = self._status_dict_cache
+        if cached is not None and cached[0] == self._status_version:
+            return cached[1]
         
-        # Final status
-        status = self.get_status()
-        yield self._status_to_dict(status)
+        status = self._status_to_dict(self.get_status())
+        self._status_dict_cache = (self._status_version, status)
+        return status
     
     def _status_to_dict(self, status: SimulationStatus) -> dict:
         """Convert SimulationStatus to a JSON-serializable dict."""
@@ -480,7 +859,7 @@ class TruthBenchSimulation:
                     "action": d.action.value,
                     "quantity": d.quantity,
                     "confidence": d.confidence,
-                    "reasoning": d.reasoning[:100] + "..." if len(d.reasoning) > 100 else d.reasoning,
+                    "reasoning": d.reasoning_short,
                 }
                 for d in status.recent_decisions
             ],
@@ -492,13 +871,7 @@ class TruthBenchSimulation:
             "simulation_id": result.simulation_id,
             "start_time": result.start_time.isoformat(),
             "end_time": result.end_time.isoformat(),
-            "config": {
-                "models": result.config.models,
-                "initial_bankroll": result.config.initial_bankroll,
-                "max_position_pct": result.config.max_position_pct,
-                "max_markets": result.config.max_markets,
-                "min_volume": result.config.min_volume,
-            },
+            "config": self._config_dict,
             "scores": self.scoring_engine.to_dict(result.scores),
             "rankings": result.rankings,
             "total_decisions": len(result.all_decisions),
@@ -7,32 +7,100 @@ This module provides full tracing of every action in the simulation:
 - Performance metrics and costs
 """
 
+import gzip
 import json
 import logging
+import queue
+import threading
 import time
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON encoder
+    orjson = None
+
+try:
+    from compression import zstd
+except ImportError:  # stdlib zstd needs Python 3.14; gzip is used otherwise
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
+# Streamed records are flushed to disk at most this long (seconds) after
+# being written; the 1 MiB file buffer also flushes itself when full
+_RECORDS_FLUSH_INTERVAL = 5.0
+
+# Trace records encoded per chunk when saving
+_SAVE_CHUNK_RECORDS = 1000
+
+
+# Second and formatted "YYYY-MM-DDTHH:MM:SS" prefix of the last record
+# timestamp formatted (records arrive in time order, so this mostly hits)
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(ns: int) -> str:
+    """Format a time.time_ns() value as an ISO 8601 UTC timestamp."""
+    global _timestamp_cache
+    seconds, fraction_ns = divmod(ns, 1_000_000_000)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{fraction_ns // 1000:06d}+00:00"
+
 
-@dataclass
+def _dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def _iter_json_chunks(obj: dict) -> Iterator[bytes]:
+    """Encode a dict as compact JSON in pieces.
+    
+    The pieces concatenate to ``_dumps(obj)``; list values are split every
+    ``_SAVE_CHUNK_RECORDS`` items so no single piece covers a whole bucket.
+    """
+    separator = b"{"
+    for key, value in obj.items():
+        yield separator + _dumps(key) + b":"
+        separator = b","
+        if isinstance(value, list) and len(value) > _SAVE_CHUNK_RECORDS:
+            item_separator = b"["
+            for start in range(0, len(value), _SAVE_CHUNK_RECORDS):
+                yield item_separator + _dumps(value[start:start + _SAVE_CHUNK_RECORDS])[1:-1]
+                item_separator = b","
+            yield b"]"
+        else:
+            yield _dumps(value)
+    yield b"}" if separator == b"," else b"{}"
+
+
+@dataclass(slots=True)
 class LLMCallTrace:
     """Trace of a single LLM API call."""
     trace_id: str
-    timestamp: str
+    timestamp: int  # time.time_ns(); formatted as ISO 8601 by to_dict()
     model_id: str
     market_ticker: str
     
-    # Request
-    system_prompt: str
+    # Request (the system prompt text is in SimulationTrace.strings)
+    system_prompt_id: int
     user_prompt: str
     temperature: float
     max_tokens: int
     
-    # Response
+    # Response (empty when parsed successfully, unless the tracer was
+    # created with store_raw_on_success)
     raw_response: str
     parsed_successfully: bool
     parse_error: str | None
@@ -50,13 +118,39 @@ class LLMCallTrace:
     completion_tokens: int | None
     total_tokens: int | None
     estimated_cost_usd: float | None
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (fields are not copied)."""
+        return {
+            "trace_id": self.trace_id,
+            "timestamp": _format_timestamp(self.timestamp),
+            "model_id": self.model_id,
+            "market_ticker": self.market_ticker,
+            "system_prompt_id": self.system_prompt_id,
+            "user_prompt": self.user_prompt,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "raw_response": self.raw_response,
+            "parsed_successfully": self.parsed_successfully,
+            "parse_error": self.parse_error,
+            "action": self.action,
+            "quantity": self.quantity,
+            "confidence": self.confidence,
+            "probability_yes": self.probability_yes,
+            "reasoning": self.reasoning,
+            "latency_ms": self.latency_ms,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "estimated_cost_usd": self.estimated_cost_usd,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeExecutionTrace:
     """Trace of a trade execution."""
     trace_id: str
-    timestamp: str
+    timestamp: int  # time.time_ns(); formatted as ISO 8601 by to_dict()
     model_id: str
     market_ticker: str
     
@@ -76,19 +170,39 @@ class TradeExecutionTrace:
     bankroll_after: float
     position_before: dict | None
     position_after: dict | None
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (fields are not copied)."""
+        return {
+            "trace_id": self.trace_id,
+            "timestamp": _format_timestamp(self.timestamp),
+            "model_id": self.model_id,
+            "market_ticker": self.market_ticker,
+            "action": self.action,
+            "requested_quantity": self.requested_quantity,
+            "executed": self.executed,
+            "executed_quantity": self.executed_quantity,
+            "execution_price": self.execution_price,
+            "total_cost": self.total_cost,
+            "error": self.error,
+            "bankroll_before": self.bankroll_before,
+            "bankroll_after": self.bankroll_after,
+            "position_before": self.position_before,
+            "position_after": self.position_after,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketStateTrace:
     """Trace of market state shown to LLMs."""
     trace_id: str
-    timestamp: str
+    timestamp: int  # time.time_ns(); formatted as ISO 8601 by to_dict()
     market_ticker: str
     decision_point_index: int
     
-    # Market info
-    title: str
-    rules_primary: str
+    # Market info (title and rules text are in SimulationTrace.strings)
+    title_id: int
+    rules_primary_id: int
     current_yes_bid: float
     current_yes_ask: float
     volume: int
@@ -103,21 +217,52 @@ class MarketStateTrace:
     
     # Hidden ground truth
     actual_result: str
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (fields are not copied)."""
+        return {
+            "trace_id": self.trace_id,
+            "timestamp": _format_timestamp(self.timestamp),
+            "market_ticker": self.market_ticker,
+            "decision_point_index": self.decision_point_index,
+            "title_id": self.title_id,
+            "rules_primary_id": self.rules_primary_id,
+            "current_yes_bid": self.current_yes_bid,
+            "current_yes_ask": self.current_yes_ask,
+            "volume": self.volume,
+            "open_interest": self.open_interest,
+            "price_history_length": self.price_history_length,
+            "price_at_open": self.price_at_open,
+            "price_at_current": self.price_at_current,
+            "price_high": self.price_high,
+            "price_low": self.price_low,
+            "actual_result": self.actual_result,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketSettlementTrace:
     """Trace of market settlement."""
     trace_id: str
-    timestamp: str
+    timestamp: int  # time.time_ns(); formatted as ISO 8601 by to_dict()
     market_ticker: str
     result: str  # 'yes' or 'no'
     
     # P&L by model
     settlements: list[dict]  # [{model_id, position_side, quantity, pnl}]
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (fields are not copied)."""
+        return {
+            "trace_id": self.trace_id,
+            "timestamp": _format_timestamp(self.timestamp),
+            "market_ticker": self.market_ticker,
+            "result": self.result,
+            "settlements": self.settlements,
+        }
 
 
-@dataclass 
+@dataclass(slots=True)
 class SimulationTrace:
     """Complete trace of a simulation run."""
     simulation_id: str
@@ -128,10 +273,23 @@ class SimulationTrace:
     # Configuration
     config: dict
     
-    # Traces (populated during simulation)
-    llm_calls: list[LLMCallTrace] = field(default_factory=list)
-    trade_executions: list[TradeExecutionTrace] = field(default_factory=list)
-    market_states: list[MarketStateTrace] = field(default_factory=list)
+    # NDJSON file holding the LLM call, trade and market state records when
+    # they are streamed instead of kept in the lists below
+    records_file: str | None = None
+    
+    # Long strings repeated across records (system prompts, market titles
+    # and rules), stored once and referenced by index from *_id fields
+    strings: list[str] = field(default_factory=list)
+    
+    # Traces (populated during simulation; the first three are bounded
+    # deques when the tracer caps the records kept in memory)
+    llm_calls: list[LLMCallTrace] | deque[LLMCallTrace] = field(default_factory=list)
+    trade_executions: list[TradeExecutionTrace] | deque[TradeExecutionTrace] = field(
+        default_factory=list
+    )
+    market_states: list[MarketStateTrace] | deque[MarketStateTrace] = field(
+        default_factory=list
+    )
     market_settlements: list[MarketSettlementTrace] = field(default_factory=list)
     
     # Aggregate metrics
@@ -139,10 +297,36 @@ class SimulationTrace:
     total_tokens: int = 0
     total_cost_usd: float = 0.0
     total_latency_ms: float = 0.0
+    # Oldest in-memory records evicted by the cap, or streamed records lost
+    # because the records writer fell behind or the file could not be written
+    dropped_records: int = 0
     
     # Final results
     final_scores: list[dict] = field(default_factory=list)
     final_rankings: list[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict, converting each trace record."""
+        return {
+            "simulation_id": self.simulation_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": self.status,
+            "config": self.config,
+            "records_file": self.records_file,
+            "strings": self.strings,
+            "llm_calls": [t.to_dict() for t in self.llm_calls],
+            "trade_executions": [t.to_dict() for t in self.trade_executions],
+            "market_states": [t.to_dict() for t in self.market_states],
+            "market_settlements": [t.to_dict() for t in self.market_settlements],
+            "total_llm_calls": self.total_llm_calls,
+            "total_tokens": self.total_tokens,
+            "total_cost_usd": self.total_cost_usd,
+            "total_latency_ms": self.total_latency_ms,
+            "dropped_records": self.dropped_records,
+            "final_scores": self.final_scores,
+            "final_rankings": self.final_rankings,
+        }
 
 
 class SimulationTracer:
@@ -150,6 +334,17 @@ class SimulationTracer:
     
     Provides comprehensive observability over the entire simulation,
     capturing every LLM call, trade, and market event.
+    
+    With ``stream_records`` enabled, LLM call, trade and market state
+    records are written to an NDJSON file as they are traced (one JSON
+    object per line, tagged with ``record_type``) instead of being held in
+    memory, and the saved trace only holds the settlements, aggregates and
+    final results. Records are encoded and written by a background thread,
+    so tracing only enqueues them.
+    
+    Otherwise ``max_records`` optionally caps how many records of each of
+    those kinds are kept in memory: the newest are kept, like a flight
+    recorder, and evictions are counted in ``dropped_records``.
     """
     
     def __init__(
@@ -157,6 +352,10 @@ class SimulationTracer:
         simulation_id: str,
         config: dict,
         output_dir: Path | None = None,
+        stream_records: bool = False,
+        max_records: int | None = None,
+        compress: bool = False,
+        store_raw_on_success: bool = False,
     ):
         """Initialize the tracer.
         
@@ -164,12 +363,26 @@ class SimulationTracer:
             simulation_id: Unique simulation identifier
             config: Simulation configuration dict
             output_dir: Directory to save traces (default: ./traces)
+            stream_records: Stream per-event records to an NDJSON file
+            max_records: Max in-memory records per kind (None = unbounded)
+            compress: Save the trace compressed, as .json.zst when zstd is
+                available and .json.gz otherwise
+            store_raw_on_success: Keep raw LLM responses that parsed
+                successfully (their content is in the parsed fields);
+                responses that failed to parse are always kept
         """
         self.simulation_id = simulation_id
         self.output_dir = output_dir or Path("traces")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         self._trace_counter = 0
+        # UTC start time used to name the saved trace file
+        self._start_wall = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        self._string_ids: dict[str, int] = {}  # Index into trace.strings
+        self._trades_traced = 0
+        self._trades_executed = 0
+        # Running per-model totals: [calls, tokens, cost_usd, latency_ms]
+        self._model_metrics: dict[str, list[float]] = {}
         
         self.trace = SimulationTrace(
             simulation_id=simulation_id,
@@ -179,8 +392,36 @@ class SimulationTracer:
             config=config,
         )
         
+        self._max_records = max_records
+        self._compress = compress
+        self._store_raw_on_success = store_raw_on_success
+        if max_records is not None:
+            self.trace.llm_calls = deque(maxlen=max_records)
+            self.trace.trade_executions = deque(maxlen=max_records)
+            self.trace.market_states = deque(maxlen=max_records)
+        
+        # Queue feeding the records writer thread (None = not streaming)
+        self._records_queue: queue.Queue | None = None
+        self._records_writer: threading.Thread | None = None
+        # Set by the writer thread when the records file can no longer be
+        # written; later records are dropped instead of queued
+        self._records_failed = False
+        self._queue_full_logged = False  # Warn once about a full queue
+        if stream_records:
+            records_path = self.output_dir / f"truthbench_{simulation_id}_records.ndjson"
+            self.trace.records_file = records_path.name
+            self._records_queue = queue.Queue(maxsize=10_000)
+            self._records_writer = threading.Thread(
+                target=self._write_records,
+                args=(open(records_path, "wb", buffering=1 << 20),),
+                name=f"trace-writer-{simulation_id}",
+                daemon=True,
+            )
+            self._records_writer.start()
+        
         logger.info(
-            f"SimulationTracer initialized for {simulation_id}",
+            "SimulationTracer initialized for %s",
+            simulation_id,
             extra={"output_dir": str(self.output_dir)},
         )
     
@@ -189,11 +430,133 @@ class SimulationTracer:
         self._trace_counter += 1
         return f"{self.simulation_id}-{self._trace_counter:06d}"
     
+    def _record(self, record_type: str, trace: Any, records: list) -> None:
+        """Stream a trace record to the records file, or keep it in memory."""
+        if self._records_failed:
+            self.trace.dropped_records += 1
+        elif self._records_queue is None:
+            if self._max_records is not None and len(records) == self._max_records:
+                self.trace.dropped_records += 1
+            records.append(trace)
+        else:
+            # Never block the caller (usually the event loop); a writer
+            # more than 10k records behind drops new ones instead
+            try:
+                self._records_queue.put_nowait((record_type, trace))
+            except queue.Full:
+                if not self._queue_full_logged:
+                    logger.warning(
+                        "Trace records writer is behind, dropping records"
+                    )
+                    self._queue_full_logged = True
+                self.trace.dropped_records += 1
+    
+    def _write_records(self, fp) -> None:
+        """Writer thread: encode queued records to the file until None.
+        
+        Buffered records are flushed _RECORDS_FLUSH_INTERVAL after the first
+        of them was written, so the file stays readable during long runs
+        without a syscall per record.
+        
+        An I/O error (e.g. a full disk) stops the thread and marks the
+        records as failed, so tracing drops records instead of queueing
+        them for a writer that is gone.
+        """
+        try:
+            with fp:
+                self._write_records_loop(fp)
+        except OSError as e:
+            logger.error(
+                "Failed to write trace records file, dropping further records: %s", e
+            )
+            self._records_failed = True
+    
+    def _write_records_loop(self, fp) -> None:
+        """Encode queued records to the file until None is dequeued."""
+        records_queue = self._records_queue
+        flush_deadline: float | None = None  # None = nothing buffered
+        
+        while True:
+            timeout = None
+            if flush_deadline is not None:
+                timeout = max(0.0, flush_deadline - time.monotonic())
+            try:
+                item = records_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False  # Idle past the deadline; just flush
+            
+            if item is None:
+                break
+            
+            if item:
+                record_type, trace = item
+                try:
+                    data = _dumps({"record_type": record_type, **trace.to_dict()})
+                except Exception as e:
+                    logger.error("Failed to encode trace record: %s", e)
+                else:
+                    # I/O errors propagate and stop the writer
+                    fp.write(data)
+                    fp.write(b"\n")
+                
+                if flush_deadline is None:
+                    flush_deadline = time.monotonic() + _RECORDS_FLUSH_INTERVAL
+            
+            if flush_deadline is not None and time.monotonic() >= flush_deadline:
+                fp.flush()
+                flush_deadline = None
+    
+    def _close_records(self) -> None:
+        """Drain the records queue and close the records file.
+        
+        Records still queued when the writer failed are counted as dropped.
+        """
+        if self._records_queue is None:
+            return
+        
+        records_queue = self._records_queue
+        writer = self._records_writer
+        # The writer may fail while the queue is full, so never block on it
+        while writer.is_alive():
+            try:
+                records_queue.put(None, timeout=0.1)
+            except queue.Full:
+                continue
+            writer.join()
+        
+        while True:
+            try:
+                item = records_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.trace.dropped_records += 1
+        
+        self._records_queue = None
+        self._records_writer = None
+    
+    def _string_id(self, text: str) -> int:
+        """Get the index of a string in the trace's string table, adding it if new."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.trace.strings)
+            self._string_ids[text] = string_id
+            self.trace.strings.append(text)
+        return string_id
+    
+    def register_system_prompt(self, text: str) -> int:
+        """Register a system prompt, returning its id for trace_llm_call.
+        
+        The text is stored once in the trace's string table; registering
+        the same text again returns the same id.
+        """
+        return self._string_id(text)
+    
     def trace_llm_call(
         self,
         model_id: str,
         market_ticker: str,
-        system_prompt: str,
+        system_prompt_id: int,
         user_prompt: str,
         temperature: float,
         max_tokens: int,
@@ -212,12 +575,15 @@ class SimulationTracer:
         estimated_cost_usd: float | None = None,
     ) -> LLMCallTrace:
         """Record an LLM API call."""
+        if parsed_successfully and not self._store_raw_on_success:
+            raw_response = ""
+        
         trace = LLMCallTrace(
             trace_id=self._next_trace_id(),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=time.time_ns(),
             model_id=model_id,
             market_ticker=market_ticker,
-            system_prompt=system_prompt,
+            system_prompt_id=system_prompt_id,
             user_prompt=user_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -236,7 +602,7 @@ class SimulationTracer:
             estimated_cost_usd=estimated_cost_usd,
         )
         
-        self.trace.llm_calls.append(trace)
+        self._record("llm_call", trace, self.trace.llm_calls)
         self.trace.total_llm_calls += 1
         self.trace.total_latency_ms += latency_ms
         if total_tokens:
@@ -244,10 +610,22 @@ class SimulationTracer:
         if estimated_cost_usd:
             self.trace.total_cost_usd += estimated_cost_usd
         
-        logger.debug(
-            f"Traced LLM call: {model_id} -> {action} on {market_ticker}",
-            extra={"trace_id": trace.trace_id},
-        )
+        metrics = self._model_metrics.get(model_id)
+        if metrics is None:
+            metrics = self._model_metrics[model_id] = [0, 0, 0.0, 0.0]
+        metrics[0] += 1
+        metrics[1] += total_tokens or 0
+        metrics[2] += estimated_cost_usd or 0.0
+        metrics[3] += latency_ms
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Traced LLM call: %s -> %s on %s",
+                model_id,
+                action,
+                market_ticker,
+                extra={"trace_id": trace.trace_id},
+            )
         
         return trace
     
@@ -270,7 +648,7 @@ class SimulationTracer:
         """Record a trade execution."""
         trace = TradeExecutionTrace(
             trace_id=self._next_trace_id(),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=time.time_ns(),
             model_id=model_id,
             market_ticker=market_ticker,
             action=action,
@@ -286,12 +664,20 @@ class SimulationTracer:
             position_after=position_after,
         )
         
-        self.trace.trade_executions.append(trace)
+        self._record("trade_execution", trace, self.trace.trade_executions)
+        self._trades_traced += 1
+        if executed:
+            self._trades_executed += 1
         
-        logger.debug(
-            f"Traced trade: {model_id} {action} {executed_quantity}@{execution_price}",
-            extra={"trace_id": trace.trace_id, "executed": executed},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Traced trade: %s %s %s@%s",
+                model_id,
+                action,
+                executed_quantity,
+                execution_price,
+                extra={"trace_id": trace.trace_id, "executed": executed},
+            )
         
         return trace
     
@@ -315,11 +701,11 @@ class SimulationTracer:
         """Record market state at a decision point."""
         trace = MarketStateTrace(
             trace_id=self._next_trace_id(),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=time.time_ns(),
             market_ticker=market_ticker,
             decision_point_index=decision_point_index,
-            title=title,
-            rules_primary=rules_primary,
+            title_id=self._string_id(title),
+            rules_primary_id=self._string_id(rules_primary),
             current_yes_bid=current_yes_bid,
             current_yes_ask=current_yes_ask,
             volume=volume,
@@ -332,12 +718,15 @@ class SimulationTracer:
             actual_result=actual_result,
         )
         
-        self.trace.market_states.append(trace)
+        self._record("market_state", trace, self.trace.market_states)
         
-        logger.debug(
-            f"Traced market state: {market_ticker} point {decision_point_index}",
-            extra={"trace_id": trace.trace_id},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Traced market state: %s point %s",
+                market_ticker,
+                decision_point_index,
+                extra={"trace_id": trace.trace_id},
+            )
         
         return trace
     
@@ -350,7 +739,7 @@ class SimulationTracer:
         """Record market settlement."""
         trace = MarketSettlementTrace(
             trace_id=self._next_trace_id(),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=time.time_ns(),
             market_ticker=market_ticker,
             result=result,
             settlements=settlements,
@@ -358,10 +747,13 @@ class SimulationTracer:
         
         self.trace.market_settlements.append(trace)
         
-        logger.debug(
-            f"Traced settlement: {market_ticker} -> {result}",
-            extra={"trace_id": trace.trace_id},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Traced settlement: %s -> %s",
+                market_ticker,
+                result,
+                extra={"trace_id": trace.trace_id},
+            )
         
         return trace
     
@@ -381,38 +773,67 @@ class SimulationTracer:
         self.trace.status = "error"
         self.trace.end_time = datetime.now(timezone.utc).isoformat()
     
-    def _dataclass_to_dict(self, obj: Any) -> Any:
-        """Recursively convert dataclasses to dicts."""
-        if hasattr(obj, '__dataclass_fields__'):
-            return {k: self._dataclass_to_dict(v) for k, v in asdict(obj).items()}
-        elif isinstance(obj, list):
-            return [self._dataclass_to_dict(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: self._dataclass_to_dict(v) for k, v in obj.items()}
-        return obj
-    
-    def save(self) -> Path:
+    def save(self, pretty: bool = False) -> Path:
         """Save trace to JSON file.
         
+        Also flushes and closes the records file when records are streamed;
+        anything traced after that is kept in memory.
+        
+        Args:
+            pretty: Indent the JSON for reading (compact by default)
+            
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"truthbench_{self.simulation_id}_{timestamp}.json"
+        self._close_records()
+        
+        filename = f"truthbench_{self.simulation_id}_{self._start_wall}.json"
         filepath = self.output_dir / filename
         
-        # Convert to dict
-        trace_dict = self._dataclass_to_dict(self.trace)
+        # A single conversion pass; nested dicts and lists are shared, not copied
+        trace_dict = self.trace.to_dict()
+        if not pretty:
+            chunks = _iter_json_chunks(trace_dict)
+        elif orjson is not None:
+            chunks = iter([orjson.dumps(
+                trace_dict,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+                default=str,
+            )])
+        else:
+            chunks = iter([json.dumps(trace_dict, indent=2, default=str).encode()])
         
-        with open(filepath, "w") as f:
-            json.dump(trace_dict, f, indent=2, default=str)
+        if self._compress:
+            filepath = filepath.with_name(f"{filename}.{'zst' if zstd else 'gz'}")
+        
+        with open(filepath, "wb") as raw:
+            if not self._compress:
+                sink = raw
+            elif zstd is not None:
+                sink = zstd.ZstdFile(raw, "wb", level=3)
+            else:
+                sink = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+            
+            # JSON encoding holds the GIL but compression and file writes
+            # release it, so a worker writes each chunk while the main
+            # thread encodes the next one. Waiting for the previous write
+            # before submitting keeps at most two chunks in memory.
+            with sink, ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                for chunk in chunks:
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(sink.write, chunk)
+                if pending is not None:
+                    pending.result()
         
         logger.info(
-            f"Saved simulation trace to {filepath}",
+            "Saved simulation trace to %s",
+            filepath,
             extra={
                 "filepath": str(filepath),
-                "llm_calls": len(self.trace.llm_calls),
-                "trades": len(self.trace.trade_executions),
+                "llm_calls": self.trace.total_llm_calls,
+                "trades": self._trades_traced,
                 "total_cost": self.trace.total_cost_usd,
             },
         )
@@ -434,8 +855,15 @@ class SimulationTracer:
                 self.trace.total_latency_ms / max(1, self.trace.total_llm_calls), 2
             ),
             "markets_processed": len(self.trace.market_settlements),
-            "trades_executed": len([
-                t for t in self.trace.trade_executions if t.executed
-            ]),
+            "trades_executed": self._trades_executed,
+            "by_model": {
+                model_id: {
+                    "llm_calls": calls,
+                    "total_tokens": tokens,
+                    "total_cost_usd": round(cost, 4),
+                    "avg_latency_ms": round(latency / calls, 2),
+                }
+                for model_id, (calls, tokens, cost, latency) in self._model_metrics.items()
+            },
         }
 